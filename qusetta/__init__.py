@@ -16,15 +16,38 @@ being the qubits. So for example a Hadamard gate on qubit 3 would be
 
 So for example, ``qusetta_circuit = ["H(0)", "CX(0, 1)", "RX(PI/2)(0)"]``.
 
+Gates can also be given in the structured form returned by
+``qusetta.gate_info``, a tuple ``(name, params, qubits)``, which skips
+parsing the strings. So the circuit above could also be written as
+``[("H", (), (0,)), ("CX", (), (0, 1)), ("RX", (PI/2,), (0,))]``, and the two
+forms can be mixed.
+
+Repeated sections of a circuit can be written as a ``qusetta.Block``, which
+can be used anywhere that a gate can. For example,
+``["H(0)", "H(1)", Block(["CX(0, 1)", "RX(0.2)(0)"], repetitions=10)]``.
+Each representation lowers blocks to its own compact form where it has one.
+
 """
 
 from ._version import *
 
+from ._parallel import *
+from ._async import *
+
 from ._gates import *
+from ._blocks import *
+from ._schedule import *
+from ._prune import *
+from ._components import *
 from ._conversions import *
+from ._lazy import *
 from ._cirq import *
 from ._qiskit import *
 from ._quasar import *
+from ._simulate import *
+
+from ._qaoa import *
+from ._random import *
 
 __all__ = "Cirq", "Qiskit", "Quasar"
 
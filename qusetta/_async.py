@@ -0,0 +1,91 @@
+"""Run conversions from asyncio without blocking the event loop."""
+
+import asyncio
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+__all__ = "set_executor",
+
+
+# the executor that the awaitable conversions run in, the maximum number of
+# conversions that may run at once, and a semaphore enforcing that maximum
+# for each event loop.
+_executor = None
+_max_concurrency = None
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_executor(executor: Optional[Executor] = None,
+                 max_concurrency: Optional[int] = None) -> None:
+    """Configure where the awaitable conversions run.
+
+    The awaitable conversions (``Cirq.ato_qiskit``, ``Qiskit.afrom_qusetta``,
+    etc) run the conversion in ``executor`` so that the event loop is free
+    while the circuit is parsed and built.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor (optional, defaults to None).
+        The executor to run the conversions in. If None, a
+        ``ThreadPoolExecutor`` is created the first time that it is needed.
+        With a ``ProcessPoolExecutor`` the circuits are pickled to and from
+        the worker processes, which keep their imports warm between calls.
+    max_concurrency : int (optional, defaults to None).
+        The most conversions that may be running or waiting in ``executor``
+        at once for each event loop; any more wait in the event loop for a
+        conversion to finish. If None, there is no limit.
+
+    Example
+    -------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> import qusetta as qs
+    >>>
+    >>> qs.set_executor(ProcessPoolExecutor(4), max_concurrency=8)
+    >>> cirq_circuit = await qs.Qiskit.ato_cirq(qiskit_circuit)
+
+    """
+    global _executor, _max_concurrency
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+    _executor, _max_concurrency = executor, max_concurrency
+    _semaphores.clear()
+
+
+async def run(function: Callable, *args, **kwargs):
+    """Run ``function(*args, **kwargs)`` in the configured executor.
+
+    Cancelling the returned coroutine cancels the call if it hasn't started
+    yet. A call that has started can't be stopped, so it keeps its slot
+    towards ``max_concurrency`` until it finishes.
+
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor()
+    executor = _executor
+
+    loop = asyncio.get_event_loop()
+    semaphore = None
+    if _max_concurrency is not None:
+        if loop not in _semaphores:
+            _semaphores[loop] = asyncio.Semaphore(_max_concurrency)
+        semaphore = _semaphores[loop]
+        await semaphore.acquire()
+
+    try:
+        future = executor.submit(partial(function, *args, **kwargs))
+    except BaseException:
+        if semaphore is not None:
+            semaphore.release()
+        raise
+
+    if semaphore is not None:
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+        future.add_done_callback(release)
+
+    # cancelling the wrapped future cancels ``future`` too.
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,148 @@
+"""Define repeated blocks in our qusetta circuit representation."""
+
+import qusetta as qs
+from typing import Dict, List, Union
+
+__all__ = "Block", "unroll", "relabel"
+
+
+class Block:
+    """A named block of gates that is repeated in a qusetta circuit.
+
+    A ``Block`` can be used in a qusetta circuit anywhere that a gate can.
+    Layered circuits such as QAOA repeat the same block many times; with a
+    ``Block`` the repeated gates are only stored and translated once, and
+    each circuit representation lowers the block to its native compact form
+    (a ``cirq.CircuitOperation`` with repetitions, a repeated qiskit
+    instruction, and so on). Representations without such a construct
+    unroll the block.
+
+    Parameters
+    ----------
+    circuit : list.
+        A qusetta circuit, see ``help(qusetta)``. The qubits are the same
+        qubits as the circuit that the block is used in. Blocks may be
+        nested.
+    repetitions : int (optional, defaults to 1).
+        The number of times to apply ``circuit``.
+    name : str (optional, defaults to ``"block"``).
+        The name of the block. Representations that name their sub-circuits
+        will use it.
+
+    Example
+    -------
+    >>> from qusetta import Block, Cirq
+    >>>
+    >>> layer = Block(["CX(0, 1)", "RZ(0.3)(1)", "CX(0, 1)", "RX(0.2)(0)"],
+    ...               repetitions=10, name="layer")
+    >>> circuit = ["H(0)", "H(1)", layer]
+    >>> cirq_circuit = Cirq.from_qusetta(circuit)
+
+    """
+
+    def __init__(self, circuit: list, repetitions: int = 1,
+                 name: str = "block"):
+        """Initialize the block. See the class docstring."""
+        if int(repetitions) != repetitions or repetitions < 1:
+            raise ValueError(
+                "repetitions must be a positive integer, not %r" % repetitions
+            )
+        self.circuit = list(circuit)
+        self.repetitions = int(repetitions)
+        self.name = name
+
+    @property
+    def qubits(self) -> List[int]:
+        """Return a sorted list of the qubits that the block acts on."""
+        qubits = set()
+        for gate in self.circuit:
+            if isinstance(gate, Block):
+                qubits.update(gate.qubits)
+            else:
+                qubits.update(qs.gate_info(gate)[2])
+        return sorted(qubits)
+
+    def __eq__(self, other) -> bool:
+        """Check if two blocks are the same."""
+        return isinstance(other, Block) and (
+            (self.circuit, self.repetitions, self.name) ==
+            (other.circuit, other.repetitions, other.name)
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the block."""
+        return "Block(%r, repetitions=%d, name=%r)" % (
+            self.circuit, self.repetitions, self.name
+        )
+
+
+def unroll(circuit: list) -> list:
+    """Unroll all of the blocks in a qusetta circuit.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``.
+
+    Returns
+    -------
+    res : list.
+        The same circuit with every ``Block`` replaced by its gates,
+        repeated ``repetitions`` times.
+
+    Example
+    -------
+    >>> unroll(["H(0)", Block(["X(0)", "Z(1)"], 2)])
+    ["H(0)", "X(0)", "Z(1)", "X(0)", "Z(1)"]
+
+    """
+    res = []
+    for gate in circuit:
+        if isinstance(gate, Block):
+            res.extend(unroll(gate.circuit) * gate.repetitions)
+        else:
+            res.append(gate)
+    return res
+
+
+def relabel(circuit: Union[list, Block],
+            mapping: Dict[int, int]) -> Union[list, Block]:
+    """Relabel the qubits of a qusetta circuit.
+
+    Parameters
+    ----------
+    circuit : list or Block.
+        See ``help(qusetta)``.
+    mapping : dict mapping ints to ints.
+        ``mapping[q]`` is the new label for qubit ``q``. Every qubit in
+        ``circuit`` must be in ``mapping``.
+
+    Returns
+    -------
+    res : list or Block.
+        The relabeled circuit, of the same type as ``circuit``.
+
+    Example
+    -------
+    >>> relabel(["H(2)", "CX(2, 5)"], {2: 0, 5: 1})
+    ["H(0)", "CX(0, 1)"]
+
+    """
+    if isinstance(circuit, Block):
+        return Block(
+            relabel(circuit.circuit, mapping),
+            circuit.repetitions, circuit.name
+        )
+
+    res = []
+    for gate in circuit:
+        if isinstance(gate, Block):
+            res.append(relabel(gate, mapping))
+            continue
+        g, params, qubits = qs.gate_info(gate)
+        qubits = tuple(mapping[q] for q in qubits)
+        if isinstance(gate, str):
+            res.append(qs.gate_string(g, params, qubits))
+        else:
+            res.append((g, params, qubits))
+    return res
@@ -1,8 +1,11 @@
 """Translating circuits to and from ``cirq``."""
 
 import cirq
+import inspect
 import qusetta as qs
-from typing import List
+import re
+from math import pi as PI
+from typing import List, Optional, Union
 
 
 __all__ = "Cirq",
@@ -10,6 +13,25 @@ __all__ = "Cirq",
 
 MAPPING = {"RX": "rx", "RY": "ry", "RZ": "rz"}
 
+# The inverses of the gates that aren't their own inverse or a rotation, up
+# to a global phase.
+INVERSE = {"S": ("RZ", (-PI/2,)), "T": ("RZ", (-PI/4,))}
+
+# Newer versions of cirq print LineQubit(0) as q(0) instead of 0.
+LINE_QUBIT = re.compile(r"q\((-?\d+)\)")
+
+# CircuitOperation is only in newer versions of cirq.
+CIRCUIT_OPERATION = getattr(cirq, "CircuitOperation", None)
+
+# The name of a block is the last entry of the CircuitOperation's
+# parent_path, which is only in even newer versions of cirq.
+PARENT_PATH = CIRCUIT_OPERATION is not None and (
+    "parent_path" in inspect.signature(CIRCUIT_OPERATION).parameters
+)
+REPETITION_IDS = CIRCUIT_OPERATION is not None and (
+    "repetition_ids" in inspect.signature(CIRCUIT_OPERATION).parameters
+)
+
 
 class Cirq(qs.Conversions):
     """Translation methods for cirq's representation of a circuit.
@@ -32,7 +54,9 @@ class Cirq(qs.Conversions):
     """
 
     @staticmethod
-    def from_qusetta(circuit: List[str]) -> cirq.Circuit:
+    def from_qusetta(circuit: List[str], *,
+                     workers: Optional[int] = None,
+                     prune: bool = False) -> cirq.Circuit:
         """Convert a qusetta circuit to a cirq circuit.
 
         Parameters
@@ -40,6 +64,13 @@ class Cirq(qs.Conversions):
         circuit : list of strings.
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
+        workers : int (optional, defaults to None).
+            The number of processes to parse the gates with, see
+            ``qusetta.parse``. The cirq circuit itself is always built in
+            this process, so the result does not depend on ``workers``.
+        prune : bool (optional, defaults to False).
+            Whether to remove the gates that don't change the probabilities
+            first, see ``qusetta.prune``.
 
         Returns
         -------
@@ -54,8 +85,17 @@ class Cirq(qs.Conversions):
 
         """
         cirq_circuit = cirq.Circuit()
-        for gate in circuit:
-            g, params, qubits = qs.gate_info(gate)
+        if prune:
+            circuit = qs.prune(circuit)
+        # each block is only lowered once, however many times it's used.
+        blocks = {}
+        for gate in qs.parse(circuit, workers):
+            if isinstance(gate, qs.Block):
+                if id(gate) not in blocks:
+                    blocks[id(gate)] = _from_block(gate)
+                cirq_circuit.append(blocks[id(gate)])
+                continue
+            g, params, qubits = gate
             qubits = [cirq.LineQubit(x) for x in qubits]
             cirq_gate = getattr(cirq, MAPPING.get(g, g))
             if params:
@@ -65,16 +105,20 @@ class Cirq(qs.Conversions):
         return cirq_circuit
 
     @staticmethod
-    def to_qusetta(circuit: cirq.Circuit) -> List[str]:
+    def to_qusetta(circuit: cirq.Circuit, *,
+                   structured: bool = False) -> List[str]:
         """Convert a cirq circuit to a qusetta circuit.
 
         Parameters
         ----------
         circuit : cirq.Circuit object.
+        structured : bool (optional, defaults to False).
+            Whether to return the gates in the structured form
+            ``(name, params, qubits)`` instead of as strings.
 
         Returns
         -------
-        qs_circuit : list of strings.
+        qs_circuit : list of strings (or tuples if ``structured``).
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
 
@@ -94,17 +138,92 @@ class Cirq(qs.Conversions):
         ["H(0)", "CX(0, 1)", "Rx(0.5)(0)", "SWAP(1, 2)"]
 
         """
-        return [
-            str(gate).strip().upper().replace(
-                "CNOT", "CX"
-            ).replace(
-                "TOFFOLI", "CCX"
-            ).replace(
-                "Π", "PI" if (
-                    hasattr(gate.gate, "exponent") and gate.gate.exponent == 1
-                ) else "*PI"
-            )
-            for gate in circuit.all_operations()
-            if not isinstance(gate.gate, cirq.MeasurementGate)
-            # ignore measurements
-        ]
+        return _to_qusetta(circuit.all_operations(), structured)
+
+
+def _to_qusetta(operations: List[cirq.Operation],
+                structured: bool = False) -> List[Union[str, tuple, qs.Block]]:
+    """Convert cirq operations, see ``Cirq.to_qusetta``."""
+    qs_circuit = []
+    for gate in operations:
+        if isinstance(gate.gate, cirq.MeasurementGate):
+            continue  # ignore measurements
+        elif CIRCUIT_OPERATION and isinstance(gate, CIRCUIT_OPERATION):
+            qs_circuit.append(_to_block(gate, structured))
+            continue
+        g = LINE_QUBIT.sub(r"\1", str(gate)).strip().upper().replace(
+            "CNOT", "CX"
+        ).replace(
+            "TOFFOLI", "CCX"
+        ).replace(
+            "Π", "PI" if (
+                hasattr(gate.gate, "exponent") and
+                gate.gate.exponent == 1
+            ) else "*PI"
+        )
+        qs_circuit.append(qs.gate_info(g) if structured else g)
+    return qs_circuit
+
+
+def _to_block(operation: "cirq.CircuitOperation",
+              structured: bool = False) -> qs.Block:
+    """Convert a ``cirq.CircuitOperation`` to a qusetta block.
+
+    Negative repetitions (the inverse of the circuit) become the inverse of
+    the circuit, repeated ``-repetitions`` times.
+
+    """
+    kwargs = dict(repetitions=1)
+    if REPETITION_IDS:  # there's one id for each repetition
+        kwargs.update(repetition_ids=None)
+    circuit = Cirq.to_qusetta(
+        operation.replace(**kwargs).mapped_circuit(), structured=structured
+    )
+    repetitions = operation.repetitions
+    if repetitions < 0:
+        circuit, repetitions = _inverse(circuit), -repetitions
+    return qs.Block(
+        circuit, repetitions, *getattr(operation, "parent_path", ())[-1:]
+    )
+
+
+def _inverse(circuit: list) -> list:
+    """Invert a qusetta circuit, up to a global phase.
+
+    Structured gates stay structured.
+
+    """
+    res = []
+    for gate in reversed(circuit):
+        if isinstance(gate, qs.Block):
+            res.append(qs.Block(
+                _inverse(gate.circuit), gate.repetitions, gate.name
+            ))
+            continue
+        g, params, qubits = qs.gate_info(gate)
+        if g in INVERSE:
+            g, params = INVERSE[g]
+        else:  # the other gates are their own inverses, or rotations
+            params = tuple(-x for x in params)
+        res.append(
+            qs.gate_string(g, params, qubits) if isinstance(gate, str)
+            else (g, params, qubits)
+        )
+    return res
+
+
+def _from_block(block: qs.Block) -> cirq.OP_TREE:
+    """Lower a qusetta block to a ``cirq.CircuitOperation``.
+
+    The name of the block is kept in the ``parent_path`` of the
+    ``CircuitOperation``. Versions of cirq without ``CircuitOperation`` get
+    the unrolled operations instead.
+
+    """
+    if CIRCUIT_OPERATION is None:
+        return list(Cirq.from_qusetta(qs.unroll([block])).all_operations())
+    kwargs = dict(parent_path=(block.name,)) if PARENT_PATH else {}
+    return CIRCUIT_OPERATION(
+        Cirq.from_qusetta(block.circuit).freeze(),
+        repetitions=block.repetitions, **kwargs
+    )
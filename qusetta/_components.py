@@ -0,0 +1,138 @@
+"""Split circuits into independent groups of qubits."""
+
+import numpy as np
+import qusetta as qs
+from typing import List, Optional, Sequence, Tuple
+
+__all__ = "components", "combine_probabilities"
+
+
+def components(circuit: list) -> List[Tuple[List[int], list]]:
+    """Split a circuit into sub-circuits on qubits that never interact.
+
+    Two qubits are in the same component if a multi-qubit gate (or a
+    ``Block``) connects them, directly or through other qubits. The
+    sub-circuits can be translated and simulated separately, which costs
+    ``2^a + 2^b`` instead of ``2^(a+b)`` for components on ``a`` and ``b``
+    qubits. Use ``combine_probabilities`` to get the probabilities of the
+    whole circuit back from the probabilities of the components.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``.
+
+    Returns
+    -------
+    res : list of tuples ``(qubits, sub_circuit)``.
+        One tuple for each component, sorted by their smallest qubits.
+        ``qubits`` is the sorted list of the qubits in the component, and
+        ``sub_circuit`` is the gates of ``circuit`` on those qubits, in the
+        same order, with qubit ``qubits[i]`` relabeled to ``i``. Gates
+        on no qubits, like an empty ``Block``, are left out.
+
+    Example
+    -------
+    >>> components(["H(0)", "H(2)", "CX(0, 3)", "RX(0.5)(1)", "CZ(1, 2)"])
+    [([0, 3], ["H(0)", "CX(0, 1)"]),
+     ([1, 2], ["H(1)", "RX(0.5)(0)", "CZ(0, 1)"])]
+
+    """
+    gates = [
+        (gate, gate.qubits if isinstance(gate, qs.Block)
+         else qs.gate_info(gate)[2])
+        for gate in circuit
+    ]
+    # gates on no qubits (an empty Block) don't do anything
+    gates = [(gate, qubits) for gate, qubits in gates if len(qubits)]
+
+    # union-find over the qubits
+    parent = {}
+
+    def find(q):
+        parent.setdefault(q, q)
+        while parent[q] != q:
+            parent[q] = parent[parent[q]]
+            q = parent[q]
+        return q
+
+    for _, qubits in gates:
+        root = find(qubits[0])
+        for q in qubits[1:]:
+            parent[find(q)] = root
+
+    groups = {}
+    for gate, qubits in gates:
+        groups.setdefault(find(qubits[0]), []).append(gate)
+    members = {}
+    for q in sorted(parent):
+        members.setdefault(find(q), []).append(q)
+
+    res = []
+    for root, qubits in sorted(members.items(), key=lambda x: x[1][0]):
+        mapping = {q: i for i, q in enumerate(qubits)}
+        res.append((qubits, qs.relabel(groups[root], mapping)))
+    return res
+
+
+def combine_probabilities(probabilities: Sequence[np.ndarray],
+                          qubits: Sequence[Sequence[int]],
+                          num_qubits: Optional[int] = None) -> np.ndarray:
+    """Combine the probabilities of independent components.
+
+    Parameters
+    ----------
+    probabilities : sequence of 1D arrays.
+        The probabilities of each component, with its qubit 0 as the most
+        significant bit (the order of every translation, see
+        ``help(qusetta.simulate)``).
+    qubits : sequence of sequences of ints.
+        The qubits of each component in the full circuit, as returned by
+        ``components``.
+    num_qubits : int (optional).
+        The number of qubits of the full circuit. Defaults to one more than
+        the largest qubit in ``qubits``. Qubits that aren't in any component
+        are in the zero state.
+
+    Returns
+    -------
+    res : 1D np.ndarray.
+        The probabilities of the full circuit, with qubit 0 as the most
+        significant bit.
+
+    Example
+    -------
+    >>> from qusetta import components, combine_probabilities, simulate
+    >>>
+    >>> circuit = ["H(0)", "H(2)", "CX(0, 3)", "RX(0.5)(1)", "CZ(1, 2)"]
+    >>> parts = components(circuit)
+    >>> probabilities = combine_probabilities(
+    ...     [simulate(c, probabilities=True) for _, c in parts],
+    ...     [qubits for qubits, _ in parts]
+    ... )
+
+    """
+    if num_qubits is None:
+        num_qubits = 1 + max((max(q) for q in qubits if len(q)), default=-1)
+    if len(probabilities) != len(qubits):
+        raise ValueError("there must be probabilities for each component")
+
+    res, order = np.ones(()), []
+    for p, q in zip(probabilities, qubits):
+        p = np.asarray(p, dtype=float)
+        if p.shape != (2 ** len(q),):
+            raise ValueError(
+                "a component on %d qubits needs %d probabilities, not %d"
+                % (len(q), 2 ** len(q), p.size)
+            )
+        res = np.multiply.outer(res, p.reshape((2,) * len(q)))
+        order.extend(q)
+
+    for q in sorted(set(range(num_qubits)) - set(order)):
+        res = np.multiply.outer(res, [1., 0.])
+        order.append(q)
+    if sorted(order) != list(range(num_qubits)):
+        raise ValueError("the components must have different qubits")
+
+    # put the axes in the order of the qubits
+    return res.transpose(np.argsort(order)).reshape(-1)
@@ -16,10 +16,16 @@ class Conversions:
     A child class *must* define a ``to_qusetta`` and a ``from_qusetta``
     staticmethod.
 
+    Every conversion also has an awaitable version prefixed with ``a``, for
+    example ``await qusetta.Qiskit.ato_cirq(circuit)``, that runs the
+    conversion in an executor instead of blocking the event loop. See
+    ``qusetta.set_executor``.
+
     """
 
     @classmethod
-    def from_cirq(cls, circuit: 'cirq.Circuit') -> 'cls.Circuit':
+    def from_cirq(cls, circuit: 'cirq.Circuit',
+                  lazy: bool = False) -> 'cls.Circuit':
         """Create a ``cls`` circuit from a cirq circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -30,16 +36,20 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : cirq.Circuit object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         cls_circuit : cls.Circuit object.
 
         """
-        return cls.from_qusetta(qs.Cirq.to_qusetta(circuit))
+        return qs._lazy.convert(qs.Cirq, cls, circuit, lazy)
 
     @classmethod
-    def to_cirq(cls, circuit: 'cls.Circuit') -> 'cirq.Circuit':
+    def to_cirq(cls, circuit: 'cls.Circuit',
+                lazy: bool = False) -> 'cirq.Circuit':
         """Create a cirq circuit from a ``cls`` circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -50,16 +60,20 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : a cls object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         cirq_circuit : cirq.Circuit object.
 
         """
-        return qs.Cirq.from_qusetta(cls.to_qusetta(circuit))
+        return qs._lazy.convert(cls, qs.Cirq, circuit, lazy)
 
     @classmethod
-    def from_qiskit(cls, circuit: 'qiskit.QuantumCircuit') -> 'cls.Circuit':
+    def from_qiskit(cls, circuit: 'qiskit.QuantumCircuit',
+                    lazy: bool = False) -> 'cls.Circuit':
         """Create a ``cls`` circuit from a qiskit circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -70,16 +84,20 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : qiskit.QuantumCircuit object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         cls_circuit : cls object.
 
         """
-        return cls.from_qusetta(qs.Qiskit.to_qusetta(circuit))
+        return qs._lazy.convert(qs.Qiskit, cls, circuit, lazy)
 
     @classmethod
-    def to_qiskit(cls, circuit: 'cls.Circuit') -> 'qiskit.QuantumCircuit':
+    def to_qiskit(cls, circuit: 'cls.Circuit',
+                  lazy: bool = False) -> 'qiskit.QuantumCircuit':
         """Create a qiskit circuit from a ``cls`` circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -90,16 +108,20 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : a cls object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         qiskit_circuit : qiskit.QuantumCircuit object.
 
         """
-        return qs.Qiskit.from_qusetta(cls.to_qusetta(circuit))
+        return qs._lazy.convert(cls, qs.Qiskit, circuit, lazy)
 
     @classmethod
-    def from_quasar(cls, circuit: 'quasar.Circuit') -> 'cls.Circuit':
+    def from_quasar(cls, circuit: 'quasar.Circuit',
+                    lazy: bool = False) -> 'cls.Circuit':
         """Create a ``cls`` circuit from a quasar circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -110,16 +132,20 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : quasar.Circuit object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         cls_circuit : cls object.
 
         """
-        return cls.from_qusetta(qs.Quasar.to_qusetta(circuit))
+        return qs._lazy.convert(qs.Quasar, cls, circuit, lazy)
 
     @classmethod
-    def to_quasar(cls, circuit: 'cls.Circuit') -> 'quasar.Circuit':
+    def to_quasar(cls, circuit: 'cls.Circuit',
+                  lazy: bool = False) -> 'quasar.Circuit':
         """Create a quasar circuit from a ``cls`` circuit.
 
         This is a classmethod. If you call this method from the class,
@@ -130,10 +156,71 @@ class Conversions:
         ----------
         cls : one of the classes in ``qusetta.__all__``.
         circuit : a cls object.
+        lazy : bool (optional, defaults to False).
+            Whether to return a ``qusetta.LazyCircuit`` that is only
+            converted when it's used, see ``help(qusetta.LazyCircuit)``.
 
         Returns
         -------
         quasar_circuit : quasar.Circuit object.
 
         """
-        return qs.Quasar.from_qusetta(cls.to_qusetta(circuit))
+        return qs._lazy.convert(cls, qs.Quasar, circuit, lazy)
+
+    @classmethod
+    async def afrom_qusetta(cls, circuit: list, **kwargs) -> 'cls.Circuit':
+        """Awaitable version of ``from_qusetta``.
+
+        Keyword arguments are passed on to ``from_qusetta``, so, for
+        example, ``workers`` can be used to parse a large circuit in
+        parallel.
+
+        """
+        return await qs._async.run(cls.from_qusetta, circuit, **kwargs)
+
+    @classmethod
+    async def ato_qusetta(cls, circuit: 'cls.Circuit', **kwargs) -> list:
+        """Awaitable version of ``to_qusetta``.
+
+        Keyword arguments are passed on to ``to_qusetta``.
+
+        """
+        return await qs._async.run(cls.to_qusetta, circuit, **kwargs)
+
+    @classmethod
+    async def afrom_cirq(cls, circuit: 'cirq.Circuit',
+                         lazy: bool = False) -> 'cls.Circuit':
+        """Awaitable version of ``from_cirq``."""
+        return await qs._async.run(cls.from_cirq, circuit, lazy=lazy)
+
+    @classmethod
+    async def ato_cirq(cls, circuit: 'cls.Circuit',
+                       lazy: bool = False) -> 'cirq.Circuit':
+        """Awaitable version of ``to_cirq``."""
+        return await qs._async.run(cls.to_cirq, circuit, lazy=lazy)
+
+    @classmethod
+    async def afrom_qiskit(
+        cls, circuit: 'qiskit.QuantumCircuit', lazy: bool = False
+    ) -> 'cls.Circuit':
+        """Awaitable version of ``from_qiskit``."""
+        return await qs._async.run(cls.from_qiskit, circuit, lazy=lazy)
+
+    @classmethod
+    async def ato_qiskit(
+        cls, circuit: 'cls.Circuit', lazy: bool = False
+    ) -> 'qiskit.QuantumCircuit':
+        """Awaitable version of ``to_qiskit``."""
+        return await qs._async.run(cls.to_qiskit, circuit, lazy=lazy)
+
+    @classmethod
+    async def afrom_quasar(cls, circuit: 'quasar.Circuit',
+                           lazy: bool = False) -> 'cls.Circuit':
+        """Awaitable version of ``from_quasar``."""
+        return await qs._async.run(cls.from_quasar, circuit, lazy=lazy)
+
+    @classmethod
+    async def ato_quasar(cls, circuit: 'cls.Circuit',
+                         lazy: bool = False) -> 'quasar.Circuit':
+        """Awaitable version of ``to_quasar``."""
+        return await qs._async.run(cls.to_quasar, circuit, lazy=lazy)
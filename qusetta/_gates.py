@@ -1,11 +1,15 @@
 """Define the gates that we allow in our qusetta circuit representation."""
 
-from typing import Tuple
+import qusetta as qs
+from typing import List, Optional, Tuple, Union
 from math import pi as PI
 # define PI so that in string gates we can have pi as an angle.
 # Because we use eval for string gates. For example, gate = "Rz(PI/2, 1)".
 
-__all__ = "PARAMETER_FREE_GATES", "PARAMETER_GATES", "gate_info"
+__all__ = (
+    "PARAMETER_FREE_GATES", "PARAMETER_GATES",
+    "gate_info", "gate_string", "parse"
+)
 
 
 PARAMETER_FREE_GATES = frozenset({
@@ -15,14 +19,20 @@ PARAMETER_FREE_GATES = frozenset({
 PARAMETER_GATES = frozenset({'RX', 'RY', 'RZ'})
 
 
-def gate_info(gate: str) -> Tuple[str, Tuple[float, ...], Tuple[int, ...]]:
-    """Get the gate info from a string gate.
+def gate_info(
+    gate: Union[str, Tuple[str, Tuple[float, ...], Tuple[int, ...]]]
+) -> Tuple[str, Tuple[float, ...], Tuple[int, ...]]:
+    """Get the gate info from a gate.
 
     Parameters
     ----------
-    gate : str.
+    gate : str or tuple.
         See ``help(qusetta)`` for how the gate should be specifed. As an
-        example, a gate could be ``H(0)`` or ``RX(PI/2)(1)``.
+        example, a gate could be ``H(0)`` or ``RX(PI/2)(1)``. A gate can
+        also be given in the structured form that this function returns,
+        for example ``("RX", (PI/2,), (1,))``, in which case the name is
+        upper-cased and checked, like the name of a string gate, and the
+        gate is returned with it.
 
     Returns
     -------
@@ -38,12 +48,19 @@ def gate_info(gate: str) -> Tuple[str, Tuple[float, ...], Tuple[int, ...]]:
     ("RX", (2,), (3,))
 
     """
+    if not isinstance(gate, str):
+        g, params, qubits = gate
+        g = g.strip().upper()
+        if g not in PARAMETER_GATES and g not in PARAMETER_FREE_GATES:
+            raise NotImplementedError("%s is not recognized" % g)
+        return g, tuple(params), tuple(qubits)
+
     i = gate.index('(')
     g = gate[:i].strip().upper()
     gate = gate[i+1:]
     if g in PARAMETER_GATES:
         j = gate.index(")")
-        params = tuple(float(eval(x)) for x in gate[:j].split(','))
+        params = tuple(_param(x) for x in gate[:j].split(','))
         i = gate.index('(')
         gate = gate[i+1:]
         j = gate.index(')')
@@ -56,3 +73,84 @@ def gate_info(gate: str) -> Tuple[str, Tuple[float, ...], Tuple[int, ...]]:
         raise NotImplementedError("%s is not recognized" % g)
 
     return g, params, qubits
+
+
+def _param(x: str) -> float:
+    """Evaluate a parameter of a string gate."""
+    try:
+        return float(x)
+    except ValueError:  # an expression, for example PI/2
+        return float(eval(x))
+
+
+def parse(circuit: list, workers: Optional[int] = None) -> list:
+    """Get the gate info of every gate in a qusetta circuit.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``.
+    workers : int (optional, defaults to None).
+        The number of processes to parse the gates with. The circuit is
+        split into ``workers`` contiguous chunks that are parsed in parallel,
+        which only pays off for very large circuits. The result is the same
+        as parsing with one process (the default).
+
+    Returns
+    -------
+    res : list.
+        ``gate_info(gate)`` for each gate in ``circuit``. Any ``Block`` in
+        ``circuit`` is left as it is.
+
+    Example
+    -------
+    >>> parse(["H(0)", "RX(PI/2)(1)"])
+    [("H", (), (0,)), ("RX", (1.5707963267948966,), (1,))]
+
+    """
+    return qs._parallel.map_chunks(_parse, circuit, workers)
+
+
+def _parse(circuit: list) -> List[tuple]:
+    """Parse a chunk of a circuit, see ``parse``."""
+    return [
+        gate if isinstance(gate, qs.Block) else gate_info(gate)
+        for gate in circuit
+    ]
+
+
+def gate_string(gate: str, params: Tuple[float, ...],
+                qubits: Tuple[int, ...]) -> str:
+    """Get the string gate from the gate info.
+
+    This is the inverse of ``gate_info``. Parameters are written exactly, so
+    ``gate_info(gate_string(*info)) == info``.
+
+    Parameters
+    ----------
+    gate : str.
+        The gate name, for example ``"H"`` or ``"RX"``.
+    params : tuple of floats.
+        The parameters of the gate (often empty).
+    qubits : tuple of ints.
+        The qubits that the gate acts on.
+
+    Returns
+    -------
+    res : str.
+        See ``help(qusetta)`` for how the gate is specified.
+
+    Example
+    -------
+    >>> gate_string("CX", (), (0, 1))
+    "CX(0, 1)"
+    >>> gate_string("RX", (0.5,), (3,))
+    "RX(0.5)(3)"
+
+    """
+    if params:
+        return "%s(%s)(%s)" % (
+            gate, ", ".join(map(repr, map(float, params))),
+            ", ".join(map(str, qubits))
+        )
+    return "%s(%s)" % (gate, ", ".join(map(str, qubits)))
@@ -0,0 +1,180 @@
+"""Delay conversions until the converted circuit is used."""
+
+import copy
+import qusetta as qs
+
+__all__ = "LazyCircuit",
+
+
+class LazyCircuit:
+    """A circuit that is only converted when it is used.
+
+    Conversions called with ``lazy=True``, for example
+    ``qusetta.Qiskit.to_cirq(circuit, lazy=True)``, return a ``LazyCircuit``
+    that only records the circuit and the representation to convert it to.
+    Converting a ``LazyCircuit`` that hasn't been used yet converts the
+    original circuit straight to the new representation, so a chain like
+    ``Cirq.to_quasar(Qiskit.to_cirq(circuit, lazy=True))`` is translated
+    once, from qiskit to quasar, without building the cirq circuit.
+
+    The conversion happens the first time that anything else is done with
+    the ``LazyCircuit``: accessing an attribute of the circuit, printing it,
+    comparing it, iterating over it, etc. From then on the ``LazyCircuit``
+    acts as the converted circuit, and ``isinstance`` checks against the
+    converted circuit's type pass, so it can be passed to the
+    representation's own functions (simulators and so on). Use
+    ``materialize`` to get the converted circuit itself.
+
+    Parameters
+    ----------
+    circuit : a circuit of the ``source`` representation.
+    source : one of the classes in ``qusetta.__all__``.
+        The representation of ``circuit``, for example ``qusetta.Qiskit``.
+    target : one of the classes in ``qusetta.__all__``.
+        The representation to convert ``circuit`` to.
+
+    Example
+    -------
+    >>> from qusetta import Cirq, Qiskit
+    >>>
+    >>> cirq_circuit = Qiskit.to_cirq(qiskit_circuit, lazy=True)
+    >>> quasar_circuit = Cirq.to_quasar(cirq_circuit)  # no cirq circuit
+    >>> print(cirq_circuit)  # the cirq circuit is built here
+
+    """
+
+    __slots__ = "_source_circuit", "_source", "_target", "_circuit"
+
+    def __init__(self, circuit, source: type, target: type):
+        """Initialize the LazyCircuit. See the class docstring."""
+        object.__setattr__(self, "_source_circuit", circuit)
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_circuit", None)
+
+    def materialize(self):
+        """Convert the circuit, if it hasn't been already, and return it."""
+        if self._circuit is None:
+            object.__setattr__(self, "_circuit", convert(
+                self._source, self._target, self._source_circuit
+            ))
+            # the original circuit isn't needed anymore
+            object.__setattr__(self, "_source_circuit", None)
+        return self._circuit
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the circuit has been converted yet."""
+        return self._circuit is not None
+
+    @property
+    def __class__(self):
+        """Pass ``isinstance`` checks against the converted circuit's type."""
+        return type(self.materialize())
+
+    def __getattr__(self, name):
+        """Get an attribute of the converted circuit."""
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        """Set an attribute of the converted circuit."""
+        setattr(self.materialize(), name, value)
+
+    def __delattr__(self, name):
+        """Delete an attribute of the converted circuit."""
+        delattr(self.materialize(), name)
+
+    def __dir__(self):
+        """List the attributes of the converted circuit."""
+        return dir(self.materialize())
+
+    def __reduce__(self):
+        """Pickle the proxy, or the converted circuit once there is one."""
+        if self.materialized:
+            return _identity, (self._circuit,)
+        return LazyCircuit, (self._source_circuit, self._source, self._target)
+
+    def __hash__(self):
+        """Hash the converted circuit, if it's hashable."""
+        return hash(self.materialize())
+
+    def __copy__(self):
+        """Copy the converted circuit."""
+        return copy.copy(self.materialize())
+
+    def __deepcopy__(self, memo):
+        """Deep copy the converted circuit."""
+        return copy.deepcopy(self.materialize(), memo)
+
+
+def _identity(circuit):
+    """Return ``circuit``, for unpickling a converted ``LazyCircuit``."""
+    return circuit
+
+
+def _forward(name: str):
+    """Make a method that calls ``name`` on the converted circuit."""
+    def method(self, *args):
+        circuit = self.materialize()
+        # a special method set to None is not supported, like a missing one
+        function = getattr(circuit, name, None)
+        if function is None:
+            if args:  # a binary operator, so let Python try the other side
+                return NotImplemented
+            raise TypeError("%s does not support %s" % (
+                type(circuit).__name__, name
+            ))
+        return function(*args)
+    method.__name__ = name
+    method.__doc__ = "Call ``%s`` on the converted circuit." % name
+    return method
+
+
+# special methods are looked up on the type, not through __getattr__, so
+# the common ones are forwarded explicitly.
+for _name in (
+    "__str__", "__repr__", "__format__", "__bool__",
+    "__len__", "__iter__", "__reversed__", "__contains__",
+    "__getitem__", "__setitem__", "__delitem__",
+    "__eq__", "__ne__", "__add__", "__radd__", "__iadd__",
+    "__mul__", "__rmul__", "__imul__", "__pow__"
+):
+    setattr(LazyCircuit, _name, _forward(_name))
+del _name
+
+
+def convert(source: type, target: type, circuit, lazy: bool = False):
+    """Convert a circuit from one representation to another.
+
+    This is what all of the methods of ``qusetta.Conversions`` do. A
+    ``LazyCircuit`` that hasn't been used yet is converted straight from its
+    original circuit.
+
+    Parameters
+    ----------
+    source : one of the classes in ``qusetta.__all__``.
+        The representation of ``circuit``.
+    target : one of the classes in ``qusetta.__all__``.
+        The representation to convert to.
+    circuit : a ``source`` circuit or a ``LazyCircuit``.
+    lazy : bool (optional, defaults to False).
+        Whether to return a ``LazyCircuit`` instead of converting now.
+
+    Returns
+    -------
+    res : a ``target`` circuit or a ``LazyCircuit``.
+
+    """
+    if type(circuit) is LazyCircuit:
+        if circuit.materialized:
+            circuit = circuit.materialize()
+        else:  # skip the intermediate representation
+            source, circuit = circuit._source, circuit._source_circuit
+
+    if lazy:
+        return LazyCircuit(circuit, source, target)
+
+    if source in (qs.Qiskit, qs.Quasar):
+        # skip formatting and parsing the gate strings
+        return target.from_qusetta(source.to_qusetta(circuit, structured=True))
+    return target.from_qusetta(source.to_qusetta(circuit))
@@ -0,0 +1,34 @@
+"""Split the work of translating one large circuit across processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Sequence
+
+__all__ = ()
+
+
+def map_chunks(function: Callable[[list], list], items: Sequence,
+               workers: Optional[int] = None) -> list:
+    """Apply ``function`` to contiguous chunks of ``items`` in parallel.
+
+    ``function`` takes a list and returns a list with one entry for each
+    entry of the input. ``items`` is split into ``workers`` contiguous
+    chunks, each chunk is handled in its own process, and the results are
+    concatenated in order. So the result is always the same as
+    ``function(list(items))``, which is what is done when ``workers`` is
+    None or 1.
+
+    ``function`` and ``items`` must be picklable, so ``function`` has to be
+    defined at the top level of a module.
+
+    """
+    items = list(items)
+    if workers is None or workers <= 1 or len(items) < 2:
+        return function(items)
+
+    size = -(-len(items) // workers)  # ceil
+    chunks = [items[i:i+size] for i in range(0, len(items), size)]
+    res = []
+    with ProcessPoolExecutor(len(chunks)) as executor:
+        for chunk in executor.map(function, chunks):
+            res.extend(chunk)
+    return res
@@ -0,0 +1,81 @@
+"""Remove gates that don't change the probabilities of a circuit."""
+
+import qusetta as qs
+from typing import Iterable, Optional
+
+__all__ = "prune",
+
+
+def prune(circuit: list, keep_qubits: Optional[Iterable[int]] = None) -> list:
+    """Remove the gates of a circuit that don't change its probabilities.
+
+    The translations only promise the same probabilities, see
+    ``help(qusetta)``, and some gates never change them.
+
+    - A diagonal gate (``Z``, ``S``, ``T``, ``RZ``, ``CZ`` and ``I``) only
+      changes phases. Each one is removed if every later gate on its qubits
+      commutes with it (is diagonal on those qubits, like the control of a
+      ``CX``), since it could then be moved to the end of the circuit.
+    - If ``keep_qubits`` is given, only the probabilities of those qubits
+      (the marginal distribution) are kept. Every gate outside of their
+      backward light cone is removed, that is every gate that can't affect
+      those qubits through the gates after it.
+
+    This is done in one backwards sweep over the circuit. Qubits in
+    ``keep_qubits`` (or every qubit of ``circuit`` if ``keep_qubits`` is
+    None) that lose all of their gates get an identity at the start of the
+    circuit, so that the translated circuits still have them.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``. Blocks are not pruned, and are never
+        removed as diagonal gates.
+    keep_qubits : iterable of ints (optional).
+        The qubits whose probabilities are needed. Defaults to all of them.
+
+    Returns
+    -------
+    res : list.
+        The circuit without the removed gates. The statevector may be
+        different, but the probabilities (of ``keep_qubits``) are the same.
+
+    Example
+    -------
+    >>> prune(["H(0)", "CX(0, 1)", "RZ(0.5)(0)", "T(1)", "H(1)", "Z(1)"])
+    ["H(0)", "CX(0, 1)", "T(1)", "H(1)"]
+    >>> prune(["H(0)", "CX(0, 1)", "H(2)", "CZ(2, 1)"], keep_qubits=[0])
+    ["H(0)", "CX(0, 1)"]
+
+    """
+    if keep_qubits is not None:
+        keep_qubits = set(keep_qubits)
+    # the qubits that the kept gates can affect the kept qubits through
+    cone = set(keep_qubits or ())
+    # the qubits with a later gate that isn't diagonal on them
+    blocked = set()
+
+    # the qubits of the circuit and of the kept gates
+    all_qubits, used, res = set(), set(), []
+    for gate in reversed(circuit):
+        if isinstance(gate, qs.Block):
+            qubits = gate.qubits
+            kinds = (None,) * len(qubits)
+        else:
+            g, _, qubits = qs.gate_info(gate)
+            kinds = ("Z",) if g == "I" else qs._schedule.KINDS[g]
+        all_qubits.update(qubits)
+
+        if all(k == "Z" for k in kinds) and blocked.isdisjoint(qubits):
+            continue  # a trailing diagonal gate
+        if keep_qubits is not None and cone.isdisjoint(qubits):
+            continue  # outside the light cone
+
+        res.append(gate)
+        used.update(qubits)
+        cone.update(qubits)
+        blocked.update(q for q, k in zip(qubits, kinds) if k != "Z")
+
+    res.reverse()
+    missing = (all_qubits if keep_qubits is None else keep_qubits) - used
+    return ["I(%d)" % q for q in sorted(missing)] + res
@@ -0,0 +1,215 @@
+"""Build QAOA circuits from graphs."""
+
+import numpy as np
+import qiskit
+import qusetta as qs
+from typing import Optional, Sequence
+
+__all__ = "QAOA", "qaoa"
+
+
+# Older versions of qiskit only have bind_parameters, which deep copies the
+# circuit and is slower than building it again.
+ASSIGN_PARAMETERS = hasattr(qiskit.QuantumCircuit, "assign_parameters")
+
+
+class QAOA:
+    """QAOA circuits for a weighted graph.
+
+    The circuit starts with a Hadamard on every qubit, followed by ``p``
+    layers. Layer ``k`` applies ``exp(-i gamma_k w_ij Z_i Z_j / 2)`` for
+    every edge ``(i, j)`` with weight ``w_ij`` (as ``CX(i, j)``,
+    ``RZ(gamma_k w_ij)(j)``, ``CX(i, j)``) and then ``RX(beta_k)`` on every
+    qubit.
+
+    The structure of the circuit only depends on the graph, so it is built
+    once when the ``QAOA`` object is created. Calling ``circuit`` with new
+    angles only computes the new angles and fills them in, which is what an
+    optimizer needs between steps. For qiskit, the qiskit circuit itself is
+    only built once for each ``p``, with a ``qiskit.circuit.Parameter`` for
+    each angle, and new angles are bound with ``assign_parameters`` (in the
+    versions of qiskit that have it).
+
+    Parameters
+    ----------
+    edges : array-like of ints with shape ``(m, 2)``.
+        The edges of the graph.
+    weights : array-like of floats with shape ``(m,)`` (optional).
+        The weight of each edge. Defaults to all ones.
+    num_qubits : int (optional).
+        The number of qubits, defaults to one more than the largest node in
+        ``edges``.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from qusetta import QAOA, Cirq
+    >>>
+    >>> qaoa = QAOA(np.array([(0, 1), (1, 2)]), np.array([1., 2.]))
+    >>> circuit = qaoa.circuit(betas=[0.1, 0.2], gammas=[0.3, 0.4])
+    >>> cirq_circuit = qaoa.circuit([0.1, 0.2], [0.3, 0.4], Cirq)
+
+    """
+
+    def __init__(self, edges: Sequence[Sequence[int]],
+                 weights: Optional[Sequence[float]] = None,
+                 num_qubits: Optional[int] = None):
+        """Initialize the QAOA object. See the class docstring."""
+        edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+        if weights is None:
+            weights = np.ones(len(edges))
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(edges),):
+            raise ValueError("there must be one weight for each edge")
+        if np.any(edges[:, 0] == edges[:, 1]):
+            raise ValueError("edges must be between two different nodes")
+        if num_qubits is None:
+            num_qubits = int(edges.max()) + 1 if len(edges) else 0
+
+        self.edges, self.weights, self.num_qubits = edges, weights, num_qubits
+
+        # the gates that don't depend on the angles, and the templates for
+        # the gates that do.
+        self._initial = ["H(%d)" % q for q in range(num_qubits)]
+        self._cost = [
+            ("CX(%d, %d)" % (i, j), "RZ(%%r)(%d)" % j)
+            for i, j in edges.tolist()
+        ]
+        self._mixer = ["RX(%%r)(%d)" % q for q in range(num_qubits)]
+        # the parameterized qiskit circuit for each p, see _qiskit
+        self._qiskit = {}
+
+    def circuit(self, betas: Sequence[float], gammas: Sequence[float],
+                representation: Optional[type] = None):
+        """Create the QAOA circuit for the angles ``betas`` and ``gammas``.
+
+        Parameters
+        ----------
+        betas : array-like of floats with shape ``(p,)``.
+            The mixer angles.
+        gammas : array-like of floats with shape ``(p,)``.
+            The cost angles.
+        representation : one of the classes in ``qusetta.__all__`` (optional).
+            If given, a circuit of that representation is returned. For
+            example, if ``representation`` is ``qusetta.Cirq``, a
+            ``cirq.Circuit`` is returned. ``qusetta.Qiskit`` circuits are
+            made by binding the angles to a parameterized qiskit circuit
+            that is only built once for each ``p``. Every other
+            representation (and qiskit without ``assign_parameters``) is
+            converted from the qusetta circuit with
+            ``representation.from_qusetta`` on every call.
+
+        Returns
+        -------
+        circuit : list of strings or a ``representation`` circuit.
+            See ``help(qusetta)`` for more details on how the list of
+            strings is formatted.
+
+        """
+        betas = np.asarray(betas, dtype=float)
+        gammas = np.asarray(gammas, dtype=float)
+        if betas.ndim != 1 or betas.shape != gammas.shape:
+            raise ValueError(
+                "betas and gammas must both be one dimensional with length p"
+            )
+
+        if representation is qs.Qiskit and ASSIGN_PARAMETERS:
+            qiskit_circuit, parameters = self._qiskit_circuit(len(betas))
+            values = np.concatenate((betas, gammas)).tolist()
+            return qiskit_circuit.assign_parameters(
+                {parameter: values[k] for k, parameter in parameters}
+            )
+
+        circuit = list(self._initial)
+        costs = np.outer(gammas, self.weights).tolist()
+        for layer, beta in zip(costs, betas.tolist()):
+            for (cx, rz), angle in zip(self._cost, layer):
+                circuit.extend((cx, rz % angle, cx))
+            circuit.extend(rx % beta for rx in self._mixer)
+
+        if representation is not None:
+            return representation.from_qusetta(circuit)
+        return circuit
+
+    def _qiskit_circuit(self, p: int):
+        """Get the parameterized qiskit circuit with ``p`` layers.
+
+        Returns the circuit and its parameters as pairs ``(k, parameter)``,
+        where ``k`` is the index of the angle in ``betas`` followed by
+        ``gammas``. Angles that aren't in the circuit (the gammas of a graph
+        without edges, for example) have no parameter. The circuit is built
+        the first time and cached.
+
+        """
+        if p not in self._qiskit:
+            betas = [qiskit.circuit.Parameter("beta_%d" % k) for k in range(p)]
+            gammas = [
+                qiskit.circuit.Parameter("gamma_%d" % k) for k in range(p)
+            ]
+            # the same circuit as ``circuit`` in the structured form, with
+            # the parameters as the angles.
+            circuit = [("H", (), (q,)) for q in range(self.num_qubits)]
+            edges = list(zip(self.edges.tolist(), self.weights.tolist()))
+            for beta, gamma in zip(betas, gammas):
+                for (i, j), w in edges:
+                    circuit.extend((
+                        ("CX", (), (i, j)), ("RZ", (gamma * w,), (j,)),
+                        ("CX", (), (i, j))
+                    ))
+                circuit.extend(
+                    ("RX", (beta,), (q,)) for q in range(self.num_qubits)
+                )
+            qiskit_circuit = qs.Qiskit.from_qusetta(circuit)
+            self._qiskit[p] = qiskit_circuit, [
+                (k, parameter) for k, parameter in enumerate(betas + gammas)
+                if parameter in qiskit_circuit.parameters
+            ]
+        return self._qiskit[p]
+
+
+def qaoa(edges: Sequence[Sequence[int]], weights: Optional[Sequence[float]],
+         p: int, betas: Sequence[float], gammas: Sequence[float],
+         representation: Optional[type] = None):
+    """Create a QAOA circuit for a weighted graph.
+
+    This is shorthand for ``QAOA(edges, weights).circuit(betas, gammas)``.
+    When the same graph is used with many different angles (for example
+    in an optimizer), create a ``QAOA`` object once and call its
+    ``circuit`` method instead.
+
+    Parameters
+    ----------
+    edges : array-like of ints with shape ``(m, 2)``.
+        The edges of the graph.
+    weights : array-like of floats with shape ``(m,)`` or None.
+        The weight of each edge. If None, all of the weights are one.
+    p : int.
+        The number of QAOA layers.
+    betas : array-like of floats with shape ``(p,)``.
+        The mixer angles.
+    gammas : array-like of floats with shape ``(p,)``.
+        The cost angles.
+    representation : one of the classes in ``qusetta.__all__`` (optional).
+        See ``QAOA.circuit``.
+
+    Returns
+    -------
+    circuit : list of strings or a ``representation`` circuit.
+        See ``help(QAOA)`` for the structure of the circuit.
+
+    Example
+    -------
+    >>> from qusetta import qaoa
+    >>> from math import pi
+    >>>
+    >>> qaoa([(0, 1), (1, 2)], None, 1, [pi/2], [pi/4])
+    ["H(0)", "H(1)", "H(2)",
+     "CX(0, 1)", "RZ(0.7853981633974483)(1)", "CX(0, 1)",
+     "CX(1, 2)", "RZ(0.7853981633974483)(2)", "CX(1, 2)",
+     "RX(1.5707963267948966)(0)", "RX(1.5707963267948966)(1)",
+     "RX(1.5707963267948966)(2)"]
+
+    """
+    if len(betas) != p or len(gammas) != p:
+        raise ValueError("betas and gammas must both have length p")
+    return QAOA(edges, weights).circuit(betas, gammas, representation)
@@ -1,13 +1,46 @@
 """Translating circuits to and from ``qiskit``."""
 
 import qiskit
+from qiskit.circuit import library
+from qiskit.circuit.exceptions import CircuitError
 import qusetta as qs
-from typing import List
+from math import pi as PI
+from typing import Dict, List, Optional, Union
 
 
 __all__ = "Qiskit",
 
 
+GATES = {
+    "I": library.IGate, "H": library.HGate, "X": library.XGate,
+    "Y": library.YGate, "Z": library.ZGate, "S": library.SGate,
+    "T": library.TGate, "CX": library.CXGate, "CZ": library.CZGate,
+    "SWAP": library.SwapGate, "CCX": library.CCXGate,
+    "RX": library.RXGate, "RY": library.RYGate, "RZ": library.RZGate
+}
+
+# How Qiskit.to_qusetta translates each qiskit gate, by the name of the
+# gate. A gate is either renamed to a qusetta gate, or expanded by a
+# function of its parameters and (already reversed) qubits that returns the
+# structured qusetta gates.
+EXTRACT = {g.lower(): g for g in qs.PARAMETER_FREE_GATES | qs.PARAMETER_GATES}
+EXTRACT.update({
+    "id": "I",
+    "u1": "RZ",  # same up to a phase factor
+    "u2": lambda params, qubits: [
+        ("RZ", (params[1] - PI/2,), qubits),
+        ("RX", (PI/2,), qubits),
+        ("RZ", (params[0] + PI/2,), qubits)
+    ],
+    "u3": lambda params, qubits: [
+        ("RZ", (params[2] - PI/2,), qubits),
+        ("RX", (params[0],), qubits),
+        ("RZ", (params[1] + PI/2,), qubits)
+    ],
+    "measure": lambda params, qubits: []  # ignore measure gates
+})
+
+
 class Qiskit(qs.Conversions):
     """Translation methods for qiskit's representation of a circuit.
 
@@ -38,7 +71,9 @@ class Qiskit(qs.Conversions):
     """
 
     @staticmethod
-    def from_qusetta(circuit: List[str]) -> qiskit.QuantumCircuit:
+    def from_qusetta(circuit: List[str], *,
+                     workers: Optional[int] = None,
+                     prune: bool = False) -> qiskit.QuantumCircuit:
         """Convert a qusetta circuit to a qiskit circuit.
 
         Parameters
@@ -46,6 +81,13 @@ class Qiskit(qs.Conversions):
         circuit : list of strings.
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
+        workers : int (optional, defaults to None).
+            The number of processes to parse the gates with, see
+            ``qusetta.parse``. The qiskit circuit itself is always built in
+            this process, so the result does not depend on ``workers``.
+        prune : bool (optional, defaults to False).
+            Whether to remove the gates that don't change the probabilities
+            first, see ``qusetta.prune``.
 
         Returns
         -------
@@ -63,31 +105,69 @@ class Qiskit(qs.Conversions):
 
         """
         n, new_circuit = -1, []
-        for gate in circuit:
-            g, params, qubits = qs.gate_info(gate)
-            n = max(max(qubits), n)
-            new_circuit.append((g.lower(), params, qubits))
+        if prune:
+            circuit = qs.prune(circuit)
+        for gate in qs.parse(circuit, workers):
+            if isinstance(gate, qs.Block):
+                g, params, qubits = gate, (), tuple(gate.qubits)
+            else:
+                g, params, qubits = gate
+            n = max(max(qubits, default=-1), n)
+            new_circuit.append((g, params, qubits))
 
         qiskit_circuit = qiskit.QuantumCircuit(n + 1)
+        # ibm is weird and reversed their qubits from everyone else.
+        # So we reverse them here; qusetta qubit q is qiskit_qubits[q].
+        qiskit_qubits = qiskit_circuit.qubits[::-1]
+        # parameter free gates are all the same, so we share one instance
+        # of each across the circuit.
+        cache = {}
+        # and each block is only lowered once, however many times it's used.
+        blocks = {}
+        # _append skips the argument broadcasting and checks that
+        # qiskit_circuit.h, qiskit_circuit.append, etc do, since our
+        # arguments are already single qubits. The checks that matter are
+        # done here instead.
+        append = qiskit_circuit._append
         for g, params, qubits in new_circuit:
-            # ibm is weird and reversed their qubits from everyone else.
-            # So we reverse them here.
-            qubits = tuple(n - q for q in qubits)
-            getattr(qiskit_circuit, g)(*(params + qubits))
+            if isinstance(g, qs.Block):
+                if not qubits:
+                    continue
+                if id(g) not in blocks:
+                    blocks[id(g)] = _from_block(g)
+                # the block's qubits are reversed too, see _from_block
+                instruction, qubits = blocks[id(g)], qubits[::-1]
+            elif params:
+                instruction = GATES[g](*params)
+            else:
+                if g not in cache:
+                    cache[g] = GATES[g]()
+                instruction = cache[g]
+            if (len(qubits) != instruction.num_qubits or
+                    len(set(qubits)) != len(qubits) or min(qubits) < 0):
+                raise CircuitError("%s can't act on qubits %s" % (
+                    instruction.name, ", ".join(map(str, qubits))
+                ))
+            append(instruction, [qiskit_qubits[q] for q in qubits], [])
 
         return qiskit_circuit
 
     @staticmethod
-    def to_qusetta(circuit: qiskit.QuantumCircuit) -> List[str]:
+    def to_qusetta(circuit: qiskit.QuantumCircuit, *,
+                   structured: bool = False) -> List[str]:
         """Convert a qiskit circuit to a qusetta circuit.
 
         Parameters
         ----------
         circuit : qiskit.QuantumCircuit object.
+        structured : bool (optional, defaults to False).
+            Whether to return the gates in the structured form
+            ``(name, params, qubits)`` instead of as strings. This skips
+            formatting (and later parsing) the strings.
 
         Returns
         -------
-        qs_circuit : list of strings.
+        qs_circuit : list of strings (or tuples if ``structured``).
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
 
@@ -109,43 +189,133 @@ class Qiskit(qs.Conversions):
         for more info.
 
         """
-        qs_circuit = []
-        for gate, qubits, _ in circuit:  # _ refers to classical bits
-            g = gate.name.upper()
-
-            if g == "MEASURE":  # ignore measure gates
-                continue
-            elif g == "ID":
-                g = "I"
-            elif g == "U1":
-                g = "RZ"  # same up to a phase factor
-            elif g == "U2":
-                # see below for why we reverse the qubits
-                r = circuit.num_qubits - qubits[0].index - 1
-                qs_circuit.extend([
-                    "RZ(%g - PI/2)(%d)" % (gate.params[1], r),
-                    "RX(PI/2)(%d)" % r,
-                    "RZ(%g + PI/2)(%d)" % (gate.params[0], r)
-                ])
-                continue
-            elif g == "U3":
-                # see below for why we reverse the qubits
-                r = circuit.num_qubits - qubits[0].index - 1
-                qs_circuit.extend([
-                    "RZ(%g - PI/2)(%d)" % (gate.params[2], r),
-                    "RX(%g)(%d)" % (gate.params[0], r),
-                    "RZ(%g + PI/2)(%d)" % (gate.params[1], r)
-                ])
-                continue
-
-            if gate.params:
-                g += "(" + ", ".join(str(x) for x in gate.params) + ")"
-            # ibm is weird and reversed their qubits from everyone else.
-            # So we reverse them here.
-            g += "(" + ", ".join(
-                str(circuit.num_qubits - q.index - 1)
-                for q in qubits
-            ) + ")"
-            qs_circuit.append(g)
-
-        return qs_circuit
+        # ibm is weird and reversed their qubits from everyone else.
+        # So we reverse them here.
+        n = circuit.num_qubits
+        index = {q: n - i - 1 for i, q in enumerate(circuit.qubits)}
+        return _to_qusetta(index, structured, circuit.data)
+
+
+def _to_qusetta(index: Dict[qiskit.circuit.Qubit, int], structured: bool,
+                data: List[tuple]) -> List[Union[str, tuple, qs.Block]]:
+    """Convert the instructions of a qiskit circuit.
+
+    ``index[q]`` is the qusetta qubit for the qiskit qubit ``q``, see
+    ``Qiskit.to_qusetta``.
+
+    """
+    labels = {q: str(i) for q, i in index.items()}
+    qs_circuit = []
+    append = qs_circuit.append
+    for gate, qubits, _ in data:  # _ refers to classical bits
+        g = EXTRACT.get(gate.name)
+
+        if g.__class__ is str:  # the common case, so it's done inline
+            if structured:
+                append((
+                    g, tuple(map(float, gate.params)),
+                    tuple([index[q] for q in qubits])
+                ))
+            elif gate.params:
+                append("%s(%s)(%s)" % (
+                    g, ", ".join([repr(float(x)) for x in gate.params]),
+                    ", ".join([labels[q] for q in qubits])
+                ))
+            else:
+                append("%s(%s)" % (g, ", ".join([labels[q] for q in qubits])))
+            continue
+
+        qubits = tuple([index[q] for q in qubits])
+        if g is not None:
+            gates = g(tuple(map(float, gate.params)), qubits)
+        elif gate.definition:
+            # composite instructions, for example blocks from from_qusetta.
+            # The block's qubits are reversed too.
+            append(qs.relabel(
+                _to_block(gate, structured), dict(enumerate(qubits[::-1]))
+            ))
+            continue
+        else:  # not a qusetta gate, so this will fail when it's used
+            gates = [(gate.name.upper(), tuple(gate.params), qubits)]
+
+        if structured:
+            qs_circuit.extend(gates)
+        else:
+            qs_circuit.extend([qs.gate_string(*x) for x in gates])
+
+    return qs_circuit
+
+
+def _from_block(block: qs.Block) -> qiskit.circuit.Instruction:
+    """Lower a qusetta block to a qiskit instruction.
+
+    The instruction acts on ``block.qubits`` compacted to ``0, 1, ...``
+    and then reversed like the rest of qiskit's qubits. So the instruction
+    should be appended to the qiskit qubits corresponding to
+    ``reversed(block.qubits)``.
+
+    """
+    qubits = block.qubits
+    qiskit_circuit = Qiskit.from_qusetta(
+        qs.relabel(block.circuit, {q: i for i, q in enumerate(qubits)})
+    )
+    qiskit_circuit.name = block.name
+    instruction = qiskit_circuit.to_instruction()
+    if block.repetitions > 1:
+        instruction = instruction.repeat(block.repetitions)
+    return instruction
+
+
+def _to_block(instruction: qiskit.circuit.Instruction,
+              structured: bool = False) -> qs.Block:
+    """Convert a composite qiskit instruction to a qusetta block.
+
+    The block acts on qubits ``0, 1, ...`` of the instruction, where the
+    qubits are reversed like the rest of qiskit's qubits.
+
+    """
+    definition, repetitions = instruction.definition, 1
+    # the circuit that the qubits of the definition belong to
+    bits = definition
+    if _is_repeat(instruction):
+        instruction, repetitions = definition[0][0], len(definition)
+        if instruction.name not in EXTRACT and instruction.definition:
+            definition = bits = instruction.definition
+        else:
+            definition = definition[:1]
+
+    if hasattr(bits, "find_bit"):
+        def position(q):
+            return bits.find_bit(q).index
+    else:  # older versions of qiskit, where definitions are lists
+        def position(q):
+            return q.index
+
+    qiskit_circuit = qiskit.QuantumCircuit(instruction.num_qubits)
+    for gate, qubits, _ in definition:  # _ refers to classical bits
+        if gate.name != "measure":  # ignore measure gates
+            qiskit_circuit.append(
+                gate, [qiskit_circuit.qubits[position(q)] for q in qubits]
+            )
+    return qs.Block(
+        Qiskit.to_qusetta(qiskit_circuit, structured=structured),
+        repetitions, instruction.name
+    )
+
+
+def _is_repeat(instruction: qiskit.circuit.Instruction) -> bool:
+    """Check if a composite qiskit instruction was made with ``repeat``.
+
+    ``Instruction.repeat(n)`` names the instruction ``name*n`` and defines
+    it as the same instruction ``n`` times on the same qubits. Checking the
+    gate alone isn't enough, since parameter free gates are shared between
+    instructions (by qiskit itself, and by ``Qiskit.from_qusetta``).
+
+    """
+    definition = instruction.definition
+    if len(definition) < 2 or not instruction.name.endswith(
+        "*%d" % len(definition)
+    ):
+        return False
+    gate, qubits = definition[0][0], tuple(definition[0][1])
+    return all(d[0] is gate and tuple(d[1]) == qubits for d in definition)
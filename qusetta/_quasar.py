@@ -1,8 +1,9 @@
 """Translating circuits to and from ``quasar``."""
 
+import numpy as np
 import quasar
 import qusetta as qs
-from typing import List
+from typing import List, Optional
 
 
 __all__ = "Quasar",
@@ -31,7 +32,9 @@ class Quasar(qs.Conversions):
     """
 
     @staticmethod
-    def from_qusetta(circuit: List[str]) -> quasar.Circuit:
+    def from_qusetta(circuit: List[str], *,
+                     workers: Optional[int] = None,
+                     prune: bool = False) -> quasar.Circuit:
         """Convert a qusetta circuit to a quasar circuit.
 
         Parameters
@@ -39,6 +42,13 @@ class Quasar(qs.Conversions):
         circuit : list of strings.
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
+        workers : int (optional, defaults to None).
+            The number of processes to parse the gates with, see
+            ``qusetta.parse``. The quasar circuit itself is always built in
+            this process, so the result does not depend on ``workers``.
+        prune : bool (optional, defaults to False).
+            Whether to remove the gates that don't change the probabilities
+            first, see ``qusetta.prune``.
 
         Returns
         -------
@@ -52,25 +62,57 @@ class Quasar(qs.Conversions):
         >>> quasar_circuit = Quasar.from_qusetta(circuit)
 
         """
+        # quasar has no way of repeating a block, so we unroll them
+        circuit = qs.unroll(circuit)
+        if prune:
+            circuit = qs.prune(circuit)
+        gates = qs.parse(circuit, workers)
+        # qusetta's angles are twice what quasars are
+        angles = iter((np.array(
+            [x for _, params, _ in gates for x in params], dtype=float
+        ) / 2).tolist())
+
         quasar_circuit = quasar.Circuit()
-        for gate in circuit:
-            g, params, qubits = qs.gate_info(gate)
-            # qusetta's angles are twice what quasars are
-            params = tuple(x / 2 for x in params)
-            getattr(quasar_circuit, MAPPING.get(g, g))(*(qubits + params))
+        # Put each gate just after the last gate on its qubits. This is where
+        # quasar's default time_placement="early" puts it, but quasar finds
+        # that time by searching every occupied time and qubit in the circuit
+        # for every gate that is added.
+        times = {}
+        for g, params, qubits in gates:
+            t = max([times.get(q, 0) for q in qubits])
+            for q in qubits:
+                times[q] = t + 1
+            if params:
+                gate = getattr(quasar.Gate, MAPPING.get(g, g))(
+                    *(next(angles) for _ in params)
+                )
+                quasar_circuit.add_gate(gate, qubits, times=t, copy=False)
+            else:
+                quasar_circuit.add_gate(getattr(quasar.Gate, g), qubits,
+                                        times=t)
         return quasar_circuit
 
     @staticmethod
-    def to_qusetta(circuit: quasar.Circuit) -> List[str]:
+    def to_qusetta(circuit: quasar.Circuit, *, structured: bool = False,
+                   workers: Optional[int] = None) -> List[str]:
         """Convert a quasar circuit to a qusetta circuit.
 
         Parameters
         ----------
         circuit : quasar.Circuit object.
+        structured : bool (optional, defaults to False).
+            Whether to return the gates in the structured form
+            ``(name, params, qubits)`` instead of as strings. This skips
+            formatting (and later parsing) the strings.
+        workers : int (optional, defaults to None).
+            The number of processes to format the strings with. The gates
+            are split into ``workers`` contiguous chunks that are formatted
+            in parallel, which only pays off for very large circuits. The
+            result does not depend on ``workers``.
 
         Returns
         -------
-        qs_circuit : list of strings.
+        qs_circuit : list of strings (or tuples if ``structured``).
             See ``help(qusetta)`` for more details on how the list of
             strings should be formatted.
 
@@ -89,14 +131,24 @@ class Quasar(qs.Conversions):
         ["H(0)", "CX(0, 1)", "RX(0.5)(0)", "SWAP(1, 2)"]
 
         """
-        qs_circuit = []
-        for (_, qubits), gate in circuit.gates.items():  # _ has time info
-            g = gate.name.upper()
-            if gate.parameters:
-                g += "(" + ", ".join(
-                    str(x * 2)  # quasar's angles are half what qusetta's are.
-                    for x in gate.parameters.values()
-                ) + ")"
-            g += "(" + ", ".join(str(q) for q in qubits) + ")"
-            qs_circuit.append(g)
-        return qs_circuit
+        names, params, qubits = [], [], []
+        for (_, q), gate in circuit.gates.items():  # _ has time info
+            names.append(gate.name.upper())
+            params.append(tuple(gate.parameters.values()))
+            qubits.append(q)
+        # quasar's angles are half what qusetta's are.
+        angles = iter((np.array(
+            [x for p in params for x in p], dtype=float
+        ) * 2).tolist())
+        params = [tuple(next(angles) for _ in p) for p in params]
+
+        if structured:
+            return list(zip(names, params, qubits))
+        return qs._parallel.map_chunks(
+            _gate_strings, zip(names, params, qubits), workers
+        )
+
+
+def _gate_strings(gates: List[tuple]) -> List[str]:
+    """Format a chunk of structured gates, see ``Quasar.to_qusetta``."""
+    return [qs.gate_string(*gate) for gate in gates]
@@ -0,0 +1,171 @@
+"""Generate random qusetta circuits."""
+
+import numpy as np
+import qusetta as qs
+from math import pi as PI
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+__all__ = "random_circuit",
+
+
+# the number of qubits that each gate acts on
+NUM_QUBITS = {"CX": 2, "CZ": 2, "SWAP": 2, "CCX": 3}
+
+
+def random_circuit(
+    num_qubits: int, depth: int, gate_set: Optional[Iterable[str]] = None,
+    seed: Optional[int] = None, batch: Optional[int] = None,
+    multi_qubit_fraction: Optional[float] = None,
+    angles: Union[Tuple[float, float], Callable] = (-2*PI, 2*PI),
+    structured: bool = False
+) -> list:
+    """Generate random qusetta circuits.
+
+    All of the random numbers for all of the circuits are drawn at once with
+    numpy, so many large circuits can be generated quickly, for example for
+    tests and benchmarks.
+
+    Parameters
+    ----------
+    num_qubits : int.
+        The number of qubits; gates act on qubits ``0`` to
+        ``num_qubits - 1``.
+    depth : int.
+        The number of gates in each circuit.
+    gate_set : iterable of strs (optional).
+        The gates to choose from. Defaults to all of the gates in
+        ``qusetta.PARAMETER_FREE_GATES`` and ``qusetta.PARAMETER_GATES``.
+        Gates on more qubits than ``num_qubits`` are left out.
+    seed : int (optional).
+        The seed for the random numbers. The same seed (and arguments) always
+        gives the same circuits.
+    batch : int (optional).
+        If given, a list of ``batch`` circuits is returned instead of one
+        circuit.
+    multi_qubit_fraction : float (optional).
+        The probability that each gate is one of the multi-qubit gates in
+        ``gate_set``. By default every gate in ``gate_set`` is equally
+        likely.
+    angles : tuple of two floats or callable (optional).
+        The distribution of the parameters of the parameter gates. Either the
+        range ``(low, high)`` of a uniform distribution (the default is
+        ``(-2*PI, 2*PI)``), or a function ``angles(rng, size)`` that takes a
+        ``numpy.random.Generator`` and returns ``size`` angles.
+    structured : bool (optional, defaults to False).
+        Whether to return the gates in the structured form
+        ``(name, params, qubits)`` instead of as strings.
+
+    Returns
+    -------
+    res : list.
+        The circuit, or a list of ``batch`` circuits. See
+        ``help(qusetta)``.
+
+    Example
+    -------
+    >>> from qusetta import random_circuit
+    >>>
+    >>> random_circuit(3, 4, ["H", "CX", "RZ"], seed=0)
+    ["RZ(1.3400246790400834)(0)", "H(0)", "H(0)", "CX(0, 2)"]
+    >>> circuits = random_circuit(20, 10000, seed=1, batch=1000)
+
+    """
+    gate_set = sorted(
+        qs.PARAMETER_FREE_GATES | qs.PARAMETER_GATES
+        if gate_set is None else set(g.upper() for g in gate_set)
+    )
+    for g in gate_set:
+        if g not in qs.PARAMETER_FREE_GATES and g not in qs.PARAMETER_GATES:
+            raise NotImplementedError("%s is not recognized" % g)
+    gate_set = [g for g in gate_set if NUM_QUBITS.get(g, 1) <= num_qubits]
+    if not gate_set:
+        raise ValueError("there are no gates on %d qubits" % num_qubits)
+
+    k = np.array([NUM_QUBITS.get(g, 1) for g in gate_set])
+    if multi_qubit_fraction is None:
+        p = None
+    elif not 0 <= multi_qubit_fraction <= 1:
+        raise ValueError("multi_qubit_fraction must be between 0 and 1")
+    elif not (k > 1).any() or (k > 1).all():
+        raise ValueError(
+            "gate_set must have both single and multi-qubit gates to set "
+            "multi_qubit_fraction"
+        )
+    else:
+        multi = k > 1
+        p = np.where(
+            multi, multi_qubit_fraction / multi.sum(),
+            (1 - multi_qubit_fraction) / (~multi).sum()
+        )
+
+    rng = np.random.default_rng(seed)
+    size = depth * (1 if batch is None else batch)
+    gates = rng.choice(len(gate_set), size=size, p=p)
+
+    # three different qubits for every gate; gates on fewer qubits use the
+    # first one or two of them.
+    a = rng.integers(num_qubits, size=size)
+    b = rng.integers(max(num_qubits - 1, 1), size=size)
+    b += b >= a
+    c = rng.integers(max(num_qubits - 2, 1), size=size)
+    c += c >= np.minimum(a, b)
+    c += c >= np.maximum(a, b)
+
+    if callable(angles):
+        params = np.asarray(angles(rng, size), dtype=float)
+    else:
+        params = rng.uniform(angles[0], angles[1], size=size)
+
+    circuit = _gates(gate_set, num_qubits, structured, gates, a, b, c, params)
+    if batch is None:
+        return circuit
+    return [circuit[i*depth:(i+1)*depth] for i in range(batch)]
+
+
+def _gates(gate_set: list, num_qubits: int, structured: bool,
+           gates: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray,
+           params: np.ndarray) -> list:
+    """Make the gates from the random numbers, see ``random_circuit``."""
+    n = num_qubits
+    k = np.array([NUM_QUBITS.get(g, 1) for g in gate_set])
+    # a number for each gate and its qubits
+    code = np.where(k[gates] == 1, a, np.where(
+        k[gates] == 2, a*n + b, (a*n + b)*n + c
+    )) + gates * n**3
+
+    # Parameter free gates with the same qubits are the same gate, so each
+    # one is only made once.
+    free = np.array([g not in qs.PARAMETER_GATES for g in gate_set])[gates]
+    unique, inverse = np.unique(code[free], return_inverse=True)
+    made = []
+    for x in unique.tolist():
+        g, x = divmod(x, n**3)
+        qubits = (
+            (x,) if k[g] == 1 else divmod(x, n) if k[g] == 2 else
+            (x // n**2, x // n % n, x % n)
+        )
+        made.append(
+            (gate_set[g], (), qubits) if structured else
+            qs.gate_string(gate_set[g], (), qubits)
+        )
+
+    # The parameter gates are all on one qubit, so all that changes between
+    # them is the angle.
+    columns = gates[~free].tolist(), a[~free].tolist(), params[~free].tolist()
+    if structured:
+        qubits = [(q,) for q in range(n)]
+        made.extend(
+            (gate_set[g], (x,), qubits[q]) for g, q, x in zip(*columns)
+        )
+    else:
+        prefix = ["%s(" % g for g in gate_set]
+        suffix = [")(%d)" % q for q in range(n)]
+        made.extend(
+            prefix[g] + repr(x) + suffix[q] for g, q, x in zip(*columns)
+        )
+
+    # where each gate is in made
+    index = np.empty(len(gates), dtype=int)
+    index[free] = inverse
+    index[~free] = np.arange(len(unique), len(made))
+    return list(map(made.__getitem__, index.tolist()))
@@ -0,0 +1,88 @@
+"""Reorder the gates of a qusetta circuit to reduce its depth."""
+
+import qusetta as qs
+
+__all__ = "reschedule",
+
+
+# For each gate, the basis that the gate is diagonal in on each of its
+# qubits; "Z" for the computational basis, "X" for the Hadamard basis, and
+# None if it is neither. Two gates commute if they are diagonal in the same
+# basis on every qubit that they share. The identity commutes with
+# everything, see ``reschedule``.
+KINDS = {
+    "Z": ("Z",), "S": ("Z",), "T": ("Z",), "RZ": ("Z",), "CZ": ("Z", "Z"),
+    "X": ("X",), "RX": ("X",),
+    "CX": ("Z", "X"), "CCX": ("Z", "Z", "X"),
+    "H": (None,), "Y": (None,), "RY": (None,), "SWAP": (None, None)
+}
+
+
+def reschedule(circuit: list) -> list:
+    """Reorder the gates of a circuit so that they can be applied earlier.
+
+    Each gate is moved as early as the gates before it allow. A gate can be
+    moved past any gate that it commutes with, so, for example, an ``RZ``
+    after a ``CZ`` or after the control of a ``CX`` is free to move before
+    it. Representations that pack gates into moments or time slots (cirq
+    and quasar) then need fewer of them to hold the circuit.
+
+    The pass makes one sweep over the circuit, so it runs in roughly linear
+    time. The gates themselves are not changed, only their order, so the
+    new circuit gives the same state as the old one.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``. Blocks are kept as they are and are not
+        moved past any gate that shares a qubit with them.
+
+    Returns
+    -------
+    res : list.
+        The same gates as ``circuit`` in the new order.
+
+    Example
+    -------
+    >>> reschedule(["H(0)", "CZ(0, 1)", "RZ(0.5)(1)"])
+    ["H(0)", "RZ(0.5)(1)", "CZ(0, 1)"]
+
+    """
+    # for each qubit, the basis of the current run of commuting gates, the
+    # last layer used on the qubit, the layers used by the current run, and
+    # the first layer that the current run can still use.
+    kind, end, used, free = {}, {}, {}, {}
+
+    layers = []
+    for gate in circuit:
+        if isinstance(gate, qs.Block):
+            qubits = gate.qubits
+            kinds = (None,) * len(qubits)
+        else:
+            g, _, qubits = qs.gate_info(gate)
+            if g == "I":
+                # the identity joins whichever run it's in
+                kinds = (kind.get(qubits[0]) or "Z",)
+            else:
+                kinds = KINDS[g]
+
+        t, commutes = 0, []
+        for q, k in zip(qubits, kinds):
+            c = k is not None and kind.get(q) == k
+            commutes.append(c)
+            t = max(t, free[q] if c else end.get(q, -1) + 1)
+        while any(c and t in used[q] for q, c in zip(qubits, commutes)):
+            t += 1
+
+        for q, k, c in zip(qubits, kinds, commutes):
+            if not c:
+                kind[q], used[q], free[q] = k, set(), end.get(q, -1) + 1
+            used[q].add(t)
+            while free[q] in used[q]:
+                free[q] += 1
+            end[q] = max(end.get(q, -1), t)
+        layers.append(t)
+
+    return [
+        circuit[i] for i in sorted(range(len(circuit)), key=layers.__getitem__)
+    ]
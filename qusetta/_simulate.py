@@ -0,0 +1,136 @@
+"""Simulate qusetta circuits with whichever simulator is fastest."""
+
+import time
+import cirq
+import numpy as np
+import qiskit
+import quasar
+import qusetta as qs
+from typing import Optional, Sequence
+
+__all__ = "simulate",
+
+
+def _cirq(circuit: list, n: int) -> np.ndarray:
+    """Simulate with cirq's statevector simulator."""
+    return _final_state(cirq.Simulator(dtype=np.complex128).simulate(
+        qs.Cirq.from_qusetta(circuit), qubit_order=cirq.LineQubit.range(n)
+    ))
+
+
+def _final_state(result) -> np.ndarray:
+    """Get the statevector from the result of ``cirq.Simulator.simulate``."""
+    if hasattr(result, "final_state_vector"):  # newer versions of cirq
+        return result.final_state_vector
+    return result.final_state
+
+
+def _qiskit(circuit: list, n: int) -> np.ndarray:
+    """Simulate with qiskit's statevector."""
+    # Qiskit.from_qusetta reverses the qubits, so the statevector is already
+    # in the same order as the other simulators.
+    return qiskit.quantum_info.Statevector.from_instruction(
+        qs.Qiskit.from_qusetta(circuit)
+    ).data
+
+
+def _quasar(circuit: list, n: int) -> np.ndarray:
+    """Simulate with quasar's statevector simulator."""
+    return quasar.QuasarSimulatorBackend().run_statevector(
+        qs.Quasar.from_qusetta(circuit), min_qubit=0, nqubit=n
+    )
+
+
+# the local statevector simulator for each representation
+SIMULATORS = {
+    qs.Cirq: _cirq, qs.Qiskit: _qiskit, qs.Quasar: _quasar
+}
+
+# the backend that autotuning picked for each set of backends and circuit
+# shape, see ``simulate``.
+_choices = {}
+
+
+def simulate(circuit: list, backends: Optional[Sequence[type]] = None,
+             probabilities: bool = False,
+             autotune: bool = True) -> np.ndarray:
+    """Simulate a qusetta circuit.
+
+    The circuit is converted to one of ``backends`` and simulated with that
+    representation's local statevector simulator. Every backend gives the
+    result in the same order, with qubit 0 as the most significant bit
+    (the qubit ordering of qiskit is taken care of, see ``help(Qiskit)``).
+    The statevector includes every qubit from 0 to the largest qubit in
+    ``circuit``.
+
+    Which simulator is fastest depends on the circuit. With ``autotune``,
+    the first circuit of each shape (the number of qubits and, roughly, the
+    number of gates and of multi-qubit gates) is simulated with every one
+    of ``backends``, and the fastest one is remembered and used for the
+    rest of the circuits of that shape.
+
+    Parameters
+    ----------
+    circuit : list.
+        See ``help(qusetta)``.
+    backends : sequence of classes in ``qusetta.__all__`` (optional).
+        The representations to choose between, for example
+        ``[qusetta.Cirq, qusetta.Quasar]``. Defaults to all of them.
+    probabilities : bool (optional, defaults to False).
+        Whether to return the probabilities instead of the statevector.
+    autotune : bool (optional, defaults to True).
+        Whether to pick the fastest of ``backends``. If False, the first of
+        ``backends`` is used.
+
+    Returns
+    -------
+    res : 1D np.ndarray.
+        The statevector, or the probabilities if ``probabilities``. The
+        statevectors of different backends may differ by a global phase.
+
+    Example
+    -------
+    >>> from qusetta import simulate, Cirq
+    >>>
+    >>> simulate(["H(0)", "CX(0, 1)"], probabilities=True)
+    array([0.5, 0. , 0. , 0.5])
+    >>> simulate(["H(0)", "CX(0, 1)"], backends=[Cirq])
+    array([0.70710678+0.j, 0.+0.j, 0.+0.j, 0.70710678+0.j])
+
+    """
+    backends = tuple(SIMULATORS if backends is None else backends)
+    for backend in backends:
+        if backend not in SIMULATORS:
+            raise ValueError("%r has no simulator" % backend)
+    if not backends:
+        raise ValueError("no backends to simulate with")
+
+    gates = qs.parse(qs.unroll(circuit))
+    n = 1 + max((max(qubits) for _, _, qubits in gates), default=-1)
+
+    if n == 0:
+        state = np.ones(1, dtype=complex)
+    elif not autotune or len(backends) == 1:
+        state = SIMULATORS[backends[0]](gates, n)
+    else:
+        shape = (
+            n, len(gates).bit_length(),
+            sum(len(qubits) > 1 for _, _, qubits in gates).bit_length()
+        )
+        key = backends, shape
+        if key in _choices:
+            state = SIMULATORS[_choices[key]](gates, n)
+        else:
+            best = None
+            for backend in backends:
+                start = time.perf_counter()
+                res = SIMULATORS[backend](gates, n)
+                duration = time.perf_counter() - start
+                if best is None or duration < best[0]:
+                    best = duration, backend, res
+            _, _choices[key], state = best
+
+    state = np.asarray(state)
+    if probabilities:
+        return np.abs(state) ** 2
+    return state
@@ -0,0 +1,117 @@
+"""Test the awaitable conversions."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pytest
+import qusetta as qs
+from qusetta import _async
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    yield
+    qs.set_executor()
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_conversions():
+    circuit = ["H(0)", "CX(0, 1)", "RX(0.5)(2)", "CCX(2, 0, 1)"]
+    qiskit_circuit = qs.Qiskit.from_qusetta(circuit)
+    quasar_circuit = qs.Quasar.from_qusetta(circuit)
+    cirq_circuit = qs.Cirq.from_qusetta(circuit)
+
+    async def convert():
+        return await asyncio.gather(
+            qs.Qiskit.afrom_qusetta(circuit),
+            qs.Qiskit.ato_cirq(qiskit_circuit),
+            qs.Cirq.afrom_qiskit(qiskit_circuit),
+            qs.Quasar.ato_qusetta(quasar_circuit, structured=True),
+            qs.Cirq.afrom_qusetta(circuit, workers=2),
+            qs.Cirq.ato_qusetta(cirq_circuit, structured=True)
+        )
+
+    res = run(convert())
+    assert res[0] == qiskit_circuit
+    assert res[1] == res[2] == qs.Qiskit.to_cirq(qiskit_circuit)
+    assert res[3] == qs.Quasar.to_qusetta(quasar_circuit, structured=True)
+    assert res[4] == cirq_circuit
+    assert res[5] == qs.Cirq.to_qusetta(cirq_circuit, structured=True)
+
+    lazy = run(qs.Qiskit.ato_cirq(qiskit_circuit, lazy=True))
+    assert type(lazy) is qs.LazyCircuit and not lazy.materialized
+    assert lazy == res[1]
+
+    qs.set_executor(ProcessPoolExecutor(1))
+    assert run(qs.Qiskit.ato_cirq(qiskit_circuit)) == res[1]
+
+
+def test_event_loop_not_blocked():
+    qaoa = qs.QAOA([(i, j) for i in range(12) for j in range(i)])
+    circuit = qaoa.circuit(np.ones(20), np.ones(20))
+
+    async def convert():
+        ticks = 0
+        task = asyncio.ensure_future(qs.Quasar.afrom_qusetta(circuit))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.001)
+        return ticks
+
+    assert run(convert()) > 1
+
+
+def test_max_concurrency():
+    qs.set_executor(ThreadPoolExecutor(8), max_concurrency=2)
+    lock, running, most = threading.Lock(), [0], [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            most[0] = max(most[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+
+    async def many():
+        await asyncio.gather(*[_async.run(work) for _ in range(8)])
+
+    run(many())
+    assert most[0] == 2
+
+    with pytest.raises(ValueError):
+        qs.set_executor(max_concurrency=0)
+
+
+def test_cancel():
+    qs.set_executor(ThreadPoolExecutor(1), max_concurrency=1)
+    started, event = [], threading.Event()
+
+    def work(i):
+        started.append(i)
+        event.wait(5)
+        return i
+
+    async def cancel():
+        first = asyncio.ensure_future(_async.run(work, 0))
+        second = asyncio.ensure_future(_async.run(work, 1))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        event.set()
+        assert await first == 0
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        # the slot is free again
+        return await _async.run(work, 2)
+
+    assert run(cancel()) == 2
+    assert started == [0, 2]
@@ -0,0 +1,32 @@
+"""Test repeated blocks."""
+
+from qusetta import Block, unroll, relabel
+import numpy as np
+
+
+def test_block():
+    block = Block(["H(2)", Block(["CX(2, 4)"], 2)], 3, "layer")
+    assert block.qubits == [2, 4]
+    assert block == Block(["H(2)", Block(["CX(2, 4)"], 2)], 3, "layer")
+    assert block != Block(["H(2)", Block(["CX(2, 4)"], 2)], 2, "layer")
+    assert eval(repr(block)) == block
+
+    with np.testing.assert_raises(ValueError):
+        Block(["H(0)"], 0)
+    with np.testing.assert_raises(ValueError):
+        Block(["H(0)"], 1.5)
+
+
+def test_unroll():
+    circuit = ["X(0)", Block(["H(0)", Block(["Z(1)"], 2)], 2), "Y(1)"]
+    assert unroll(circuit) == [
+        "X(0)", "H(0)", "Z(1)", "Z(1)", "H(0)", "Z(1)", "Z(1)", "Y(1)"
+    ]
+    assert unroll(["H(0)"]) == ["H(0)"]
+
+
+def test_relabel():
+    circuit = ["H(2)", Block(["CX(2, 5)", "RX(0.5)(5)"], 3, "b")]
+    assert relabel(circuit, {2: 0, 5: 1}) == [
+        "H(0)", Block(["CX(0, 1)", "RX(0.5)(1)"], 3, "b")
+    ]
@@ -0,0 +1,87 @@
+"""Test splitting circuits into independent components."""
+
+from qusetta import (
+    Block, Cirq, Qiskit, Quasar, combine_probabilities, components, relabel,
+    random_circuit, simulate
+)
+import numpy as np
+
+
+def test_components():
+    circuit = ["H(0)", "H(2)", "CX(0, 3)", "RX(0.5)(1)", "CZ(1, 2)"]
+    assert components(circuit) == [
+        ([0, 3], ["H(0)", "CX(0, 1)"]),
+        ([1, 2], ["H(1)", "RX(0.5)(0)", "CZ(0, 1)"])
+    ]
+
+    # connected through other qubits
+    assert components(["CX(0, 2)", "CX(2, 4)", "H(1)"]) == [
+        ([0, 2, 4], ["CX(0, 1)", "CX(1, 2)"]), ([1], ["H(0)"])
+    ]
+
+    # blocks connect all of their qubits, structured gates stay structured
+    block = Block(["H(0)", "H(1)"], 2)
+    parts = components([relabel(block, {0: 1, 1: 3}), ("H", (), (2,))])
+    assert [qubits for qubits, _ in parts] == [[1, 3], [2]]
+    assert parts[0][1][0].qubits == [0, 1]
+    assert parts[1][1] == [("H", (), (0,))]
+
+    # gates on no qubits are left out
+    assert components(["H(0)", Block([], 2)]) == [([0], ["H(0)"])]
+    assert components([Block([])]) == []
+
+    assert components([]) == []
+
+
+def test_combine_probabilities():
+    np.testing.assert_allclose(
+        combine_probabilities([[0, 1], [.5, .5]], [[1], [0]]),
+        [0, .5, 0, .5]
+    )
+    # qubits that aren't in a component are 0
+    np.testing.assert_allclose(
+        combine_probabilities([[0, 1]], [[1]], num_qubits=3),
+        [0, 0, 1, 0, 0, 0, 0, 0]
+    )
+    np.testing.assert_allclose(combine_probabilities([], []), [1])
+
+    np.testing.assert_raises(
+        ValueError, combine_probabilities, [[1, 0]], [[0, 1]]
+    )
+    np.testing.assert_raises(
+        ValueError, combine_probabilities, [[1, 0], [1, 0]], [[0], [0]]
+    )
+    np.testing.assert_raises(
+        ValueError, combine_probabilities, [[1, 0]], [[0], [1]]
+    )
+
+
+def test_components_random():
+    for seed in range(10):
+        # independent circuits packed into one register
+        sizes = 1 + np.random.default_rng(seed).integers(3, size=3)
+        offsets = np.cumsum([0, *sizes])
+        packed = []
+        for i, n in enumerate(sizes.tolist()):
+            c = random_circuit(n, 8, seed=seed + i)
+            # every qubit gets a gate so that it's in the circuit
+            c += ["I(%d)" % q for q in range(n)]
+            packed.extend(relabel(c, {q: q + offsets[i] for q in range(n)}))
+
+        parts = components(packed)
+        assert len(parts) >= len(sizes)
+        qubits = [q for q, _ in parts]
+        assert sorted(sum(qubits, [])) == list(range(offsets[-1]))
+
+        for _, c in parts:  # each one converts to every backend
+            for backend in (Cirq, Qiskit, Quasar):
+                backend.from_qusetta(c)
+
+        probabilities = combine_probabilities(
+            [simulate(c, [Quasar], probabilities=True) for _, c in parts],
+            qubits
+        )
+        np.testing.assert_allclose(
+            probabilities, simulate(packed, [Quasar], probabilities=True),
+            atol=1e-10
+        )
@@ -0,0 +1,235 @@
+"""Differential fuzzing of the translations.
+
+Random circuits are generated over the full qusetta gate set and every
+conversion pair in ``qusetta.Conversions`` is checked by simulating the
+source circuit and the converted circuit and comparing the resulting
+probability distributions. Circuits are checked in parallel across a
+process pool. The first failing circuit of each conversion pair and error
+type is shrunk to a minimal reproducer.
+
+Under pytest a fixed number of seeds is checked, ``QUSETTA_FUZZ_SEEDS``
+(default 64) seeds starting from ``QUSETTA_FUZZ_SEED`` (default 0), and
+any reproducers are reported in the failure; they are written to a
+temporary directory, not to the source tree. Calling this file directly
+fuzzes for longer and saves the reproducers to the regression corpus in
+``tests/fuzz_corpus``, which is replayed every time the tests are run, for
+example
+
+    python tests/test_fuzz.py --seconds 3600 --workers 8
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import numpy as np
+import qiskit
+import qusetta as qs
+from test_translation import Simulator
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "fuzz_corpus")
+
+BACKENDS = "Cirq", "Qiskit", "Quasar"
+
+PAIRS = tuple((s, t) for s in BACKENDS for t in BACKENDS)
+
+# the random circuits have 3 to MAX_QUBITS qubits and 1 to MAX_GATES gates
+MAX_QUBITS, MAX_GATES = 5, 30
+
+
+def probabilities(backend: str, circuit) -> np.ndarray:
+    """Simulate a ``backend`` circuit and return its probabilities."""
+    if backend == "Qiskit":
+        # BasicAer runs jobs in its own process pool, which deadlocks when
+        # it is started from inside one of our worker processes.
+        state = qiskit.quantum_info.Statevector.from_instruction(circuit)
+        return np.abs(state.data) ** 2
+    return np.abs(getattr(Simulator, backend.lower())(circuit)) ** 2
+
+
+def check_pair(pair: Tuple[str, str], n: int,
+               circuit: List[str]) -> Optional[str]:
+    """Check one conversion pair on a circuit.
+
+    The circuit is prefixed with identities on every qubit so that all of
+    the simulators agree on the number of qubits.
+
+    Returns ``None`` if the pair agrees, otherwise a description of the
+    failure.
+
+    """
+    s, t = pair
+    circuit = ["I(%d)" % q for q in range(n)] + list(circuit)
+    try:
+        source = getattr(qs, s).from_qusetta(circuit)
+        target = getattr(getattr(qs, t), "from_" + s.lower())(source)
+        np.testing.assert_allclose(
+            probabilities(s, source), probabilities(t, target), atol=1e-7
+        )
+    except Exception as e:
+        return "%s: %s" % (type(e).__name__, str(e).strip())
+    return None
+
+
+def check_seed(seed: int) -> Tuple[int, List[str], list]:
+    """Check every conversion pair on a random circuit from ``seed``.
+
+    Returns the number of qubits, the circuit, and the failing pairs with
+    their errors.
+
+    """
+    n, depth = np.random.default_rng(seed).integers(
+        (3, 1), (MAX_QUBITS + 1, MAX_GATES + 1)
+    ).tolist()
+    circuit = qs.random_circuit(n, depth, seed=seed)
+    failures = []
+    for pair in PAIRS:
+        error = check_pair(pair, n, circuit)
+        if error is not None:
+            failures.append((pair, error))
+    return n, circuit, failures
+
+
+def shrink(pair: Tuple[str, str], n: int,
+           circuit: List[str]) -> List[str]:
+    """Shrink a failing circuit to a minimal reproducer.
+
+    Chunks of gates are removed for as long as ``pair`` keeps failing,
+    halving the chunk size until single gates can't be removed.
+
+    """
+    chunk = max(len(circuit) // 2, 1)
+    while True:
+        i = 0
+        while i < len(circuit):
+            candidate = circuit[:i] + circuit[i+chunk:]
+            if candidate and check_pair(pair, n, candidate):
+                circuit = candidate
+            else:
+                i += chunk
+        if chunk == 1:
+            return circuit
+        chunk = max(chunk // 2, 1)
+
+
+def reproducer(directory: str, pair: Tuple[str, str], error: str) -> str:
+    """The filename of the reproducer for ``pair`` failing with ``error``.
+
+    There is one reproducer for each conversion pair and error type, so the
+    same bug found from many seeds is only saved once.
+
+    """
+    return os.path.join(directory, "%s_%s_%s.json" % (
+        pair + (error.split(":")[0],)
+    ))
+
+
+def save(filename: str, pair: Tuple[str, str], n: int,
+         circuit: List[str]) -> None:
+    """Write a reproducer to ``filename``."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    entry = dict(
+        pair=list(pair), num_qubits=n, circuit=circuit,
+        error=check_pair(pair, n, circuit)
+    )
+    with open(filename, "w") as f:
+        json.dump(entry, f, indent=2)
+
+
+def load_corpus(directory: str = CORPUS) -> List[dict]:
+    """Load all of the reproducers in ``directory``."""
+    if not os.path.isdir(directory):
+        return []
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name)) as f:
+                corpus.append(json.load(f))
+    return corpus
+
+
+def fuzz(directory: str, seeds: Optional[int] = None,
+         seconds: Optional[float] = None, workers: Optional[int] = None,
+         seed: int = 0, batch: int = 16) -> List[str]:
+    """Fuzz the translations.
+
+    Seeds ``seed, seed + 1, ...`` are checked in batches across a pool of
+    ``workers`` processes, until ``seeds`` seeds have been checked or
+    ``seconds`` seconds have passed (at least one of them must be given).
+    The first failure of each conversion pair and error type is shrunk and
+    saved to ``directory``, unless ``directory`` already has a reproducer
+    for it.
+
+    Returns the filenames of the new reproducers.
+
+    """
+    if seeds is None and seconds is None:
+        raise ValueError("seeds or seconds must be given")
+    stop = None if seeds is None else seed + seeds
+    deadline = None if seconds is None else time.time() + seconds
+
+    found = []
+    with ProcessPoolExecutor(workers) as executor:
+        while ((stop is None or seed < stop) and
+               (deadline is None or time.time() < deadline)):
+            seeds_ = range(seed, seed + batch if stop is None
+                           else min(seed + batch, stop))
+            seed = seeds_.stop
+            for n, circuit, failures in executor.map(check_seed, seeds_):
+                for pair, error in failures:
+                    filename = reproducer(directory, pair, error)
+                    if not os.path.exists(filename):
+                        save(filename, pair, n, shrink(pair, n, circuit))
+                        found.append(filename)
+    return found
+
+
+# begin tests
+
+
+def test_corpus():
+    for entry in load_corpus():
+        error = check_pair(
+            tuple(entry["pair"]), entry["num_qubits"], entry["circuit"]
+        )
+        assert error is None, entry
+
+
+def test_fuzz(tmp_path):
+    seed = int(os.environ.get("QUSETTA_FUZZ_SEED", 0))
+    seeds = int(os.environ.get("QUSETTA_FUZZ_SEEDS", 64))
+    assert not fuzz(str(tmp_path), seeds=seeds, seed=seed), "\n".join(
+        json.dumps(entry) for entry in load_corpus(str(tmp_path))
+    )
+
+
+def test_shrink(monkeypatch):
+    # pretend that every circuit with a CCX gate is a failure
+    def failing(pair, n, circuit):
+        return "CCX" if any(g.startswith("CCX") for g in circuit) else None
+
+    monkeypatch.setattr(sys.modules[__name__], "check_pair", failing)
+    circuit = ["H(0)", "CX(0, 1)", "CCX(0, 1, 2)", "RX(0.5)(2)", "Z(1)"]
+    assert shrink(("Cirq", "Qiskit"), 3, circuit) == ["CCX(0, 1, 2)"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="defaults to 60 if --seeds isn't given")
+    parser.add_argument("--seeds", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.seconds is None and args.seeds is None:
+        args.seconds = 60
+
+    for filename in fuzz(CORPUS, args.seeds, args.seconds, args.workers,
+                         args.seed):
+        print(filename)
@@ -1,6 +1,6 @@
 """Test gate info."""
 
-from qusetta import gate_info
+from qusetta import Block, gate_info, gate_string, parse
 import numpy as np
 from math import pi
 
@@ -14,3 +14,36 @@ def test_gate_info():
 
     with np.testing.assert_raises(NotImplementedError):
         gate_info("a(1, 2)")
+
+
+def test_gate_info_structured():
+    assert gate_info(("H", (), (0,))) == ("H", (), (0,))
+    assert gate_info(("RX", [1.2], [3])) == ("RX", (1.2,), (3,))
+    # names are upper-cased like the names of string gates
+    assert gate_info(("h", (), (0,))) == gate_info("h(0)") == ("H", (), (0,))
+    assert gate_info(("Rx", (1.2,), (3,))) == ("RX", (1.2,), (3,))
+
+    with np.testing.assert_raises(NotImplementedError):
+        gate_info(("a", (), (1, 2)))
+
+
+def test_gate_string():
+    assert gate_string("H", (), (0,)) == "H(0)"
+    assert gate_string("CX", (), (0, 1)) == "CX(0, 1)"
+    assert gate_string("RX", (1.2,), (3,)) == "RX(1.2)(3)"
+
+    for gate in "CCX(0, 2, 1)", "RY(PI/3)(2)", "RZ(-1e-12)(0)":
+        info = gate_info(gate)
+        assert gate_info(gate_string(*info)) == info
+
+
+def test_parse():
+    block = Block(["X(1)"], 3)
+    circuit = ["H(0)", ("RX", (1.2,), (3,)), block, "RY(PI/2)(2)"] * 5
+    expected = [
+        ("H", (), (0,)), ("RX", (1.2,), (3,)), block, ("RY", (pi/2,), (2,))
+    ] * 5
+
+    assert parse(circuit) == expected
+    assert parse(circuit, workers=3) == expected
+    assert parse([], workers=3) == []
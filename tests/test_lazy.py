@@ -0,0 +1,90 @@
+"""Test lazy conversions."""
+
+import copy
+import pickle
+import cirq
+import qiskit
+import quasar
+import numpy as np
+import qusetta as qs
+from qusetta import LazyCircuit
+from test_translation import Simulator
+
+
+CIRCUIT = ["H(0)", "CX(0, 1)", "RX(0.5)(2)", "CCX(2, 0, 1)", "T(1)"]
+
+
+def test_lazy():
+    qiskit_circuit = qs.Qiskit.from_qusetta(CIRCUIT)
+    cirq_circuit = qs.Qiskit.to_cirq(qiskit_circuit)
+
+    lazy = qs.Qiskit.to_cirq(qiskit_circuit, lazy=True)
+    assert type(lazy) is LazyCircuit and not lazy.materialized
+
+    # chained conversions skip the cirq circuit
+    quasar_circuit = qs.Cirq.to_quasar(lazy)
+    assert not lazy.materialized
+    assert type(quasar_circuit) is quasar.Circuit
+    assert qs.Quasar.to_qusetta(quasar_circuit) == qs.Quasar.to_qusetta(
+        qs.Qiskit.to_quasar(qiskit_circuit)
+    )
+    chained = qs.Quasar.from_cirq(
+        qs.Qiskit.to_cirq(qiskit_circuit, lazy=True), lazy=True
+    )
+    assert type(chained) is LazyCircuit and isinstance(chained, quasar.Circuit)
+    assert chained.materialized
+
+    # it acts like the cirq circuit
+    lazy = qs.Qiskit.to_cirq(qiskit_circuit, lazy=True)
+    assert str(lazy) == str(cirq_circuit)
+    assert lazy.materialized
+    assert lazy == cirq_circuit and cirq_circuit == lazy
+    assert isinstance(lazy, cirq.Circuit)
+    assert len(lazy) == len(cirq_circuit)
+    assert list(lazy) == list(cirq_circuit)
+    assert lazy.materialize() == cirq_circuit
+    assert type(lazy.materialize()) is cirq.Circuit
+    assert copy.deepcopy(lazy) == cirq_circuit
+
+    # once it's been used, conversions use the used circuit
+    lazy.append(cirq.X(cirq.LineQubit(0)))
+    assert qs.Cirq.to_qusetta(lazy)[-1] == "X(0)"
+    assert qs.Cirq.to_qiskit(lazy) == qs.Cirq.to_qiskit(lazy.materialize())
+
+
+def test_lazy_simulate():
+    qiskit_circuit = qs.Qiskit.from_qusetta(CIRCUIT)
+    probs = np.abs(Simulator.qiskit(qiskit_circuit)) ** 2
+
+    lazy = qs.Quasar.from_qiskit(qiskit_circuit, lazy=True)
+    np.testing.assert_allclose(np.abs(Simulator.quasar(lazy)) ** 2, probs)
+    lazy = qs.Qiskit.to_cirq(qiskit_circuit, lazy=True)
+    np.testing.assert_allclose(np.abs(Simulator.cirq(lazy)) ** 2, probs)
+    lazy = qs.Cirq.to_qiskit(qs.Cirq.from_qusetta(CIRCUIT), lazy=True)
+    np.testing.assert_allclose(
+        np.abs(qiskit.quantum_info.Statevector.from_instruction(lazy).data)
+        ** 2, probs
+    )
+
+
+def test_lazy_hash():
+    qiskit_circuit = qs.Qiskit.from_qusetta(CIRCUIT)
+    # cirq circuits set __hash__ to None
+    with np.testing.assert_raises_regex(TypeError, "unhashable type"):
+        hash(qs.Qiskit.to_cirq(qiskit_circuit, lazy=True))
+    # quasar circuits don't have __reversed__
+    with np.testing.assert_raises(TypeError):
+        reversed(qs.Qiskit.to_quasar(qiskit_circuit, lazy=True))
+
+
+def test_lazy_pickle():
+    qiskit_circuit = qs.Qiskit.from_qusetta(CIRCUIT)
+    lazy = pickle.loads(pickle.dumps(
+        qs.Qiskit.to_cirq(qiskit_circuit, lazy=True)
+    ))
+    assert type(lazy) is LazyCircuit and not lazy.materialized
+    assert lazy == qs.Qiskit.to_cirq(qiskit_circuit)
+
+    circuit = pickle.loads(pickle.dumps(lazy))
+    assert type(circuit) is cirq.Circuit
+    assert circuit == lazy
@@ -0,0 +1,63 @@
+"""Test pruning circuits."""
+
+from qusetta import (
+    Block, Cirq, Quasar, gate_info, prune, random_circuit, simulate
+)
+import numpy as np
+
+
+def marginal(circuit, qubits):
+    """The probabilities of ``qubits``, with qubit 0 most significant."""
+    probs = simulate(circuit, [Quasar], probabilities=True)
+    n = int(np.log2(len(probs)))
+    others = tuple(q for q in range(n) if q not in qubits)
+    return probs.reshape((2,) * n).sum(axis=others).flatten()
+
+
+def test_prune():
+    circuit = ["H(0)", "CX(0, 1)", "RZ(0.5)(0)", "T(1)", "H(1)", "Z(1)"]
+    assert prune(circuit) == ["H(0)", "CX(0, 1)", "T(1)", "H(1)"]
+
+    circuit = ["H(0)", "CX(0, 1)", "H(2)", "CZ(2, 1)"]
+    assert prune(circuit) == ["H(0)", "CX(0, 1)", "H(2)"]
+    assert prune(circuit, keep_qubits=[0]) == ["H(0)", "CX(0, 1)"]
+    assert prune(circuit, keep_qubits=[2]) == ["H(2)"]
+    assert prune(circuit, keep_qubits=[3]) == ["I(3)"]
+
+    # qubits keep an identity so that they're still in the circuit
+    assert prune(["RZ(1)(2)", "H(0)"]) == ["I(2)", "H(0)"]
+    assert prune([("CZ", (), (0, 1))]) == ["I(0)", "I(1)"]
+
+    # blocks are never removed as diagonal gates
+    block = Block(["Z(0)"], 2)
+    assert prune(["H(0)", block]) == ["H(0)", block]
+    assert prune(["H(0)", block, "H(1)"], keep_qubits=[1]) == ["H(1)"]
+
+    assert prune([]) == []
+
+
+def test_prune_random():
+    n = 5
+    for circuit in random_circuit(n, 40, seed=2, batch=30):
+        circuit = ["I(%d)" % q for q in range(n)] + circuit
+        pruned = prune(circuit)
+        assert len(pruned) <= len(circuit)
+        np.testing.assert_allclose(
+            simulate(pruned, [Quasar], probabilities=True),
+            simulate(circuit, [Quasar], probabilities=True), atol=1e-10
+        )
+
+        keep = [0, n - 1]
+        np.testing.assert_allclose(
+            marginal(prune(circuit, keep), keep), marginal(circuit, keep),
+            atol=1e-10
+        )
+
+
+def test_from_qusetta_prune():
+    circuit = ["H(0)", "CX(0, 1)", "RZ(0.5)(0)", "T(1)", "CZ(0, 1)"]
+    assert len(Cirq.from_qusetta(circuit, prune=True)) == 2
+    assert [
+        gate_info(g)[0]
+        for g in Quasar.to_qusetta(Quasar.from_qusetta(circuit, prune=True))
+    ] == ["H", "CX"]
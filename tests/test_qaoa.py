@@ -0,0 +1,93 @@
+"""Test the QAOA circuit builder."""
+
+import qusetta as qs
+import numpy as np
+
+
+def notebook_circuit(beta, gamma):
+    # how notebook_examples/QAOA_example.ipynb builds the circuit
+    circuit = "H(0); H(1); H(2); "
+    circuit += "CX(0, 1); RZ({gamma})(1); CX(0, 1); "
+    circuit += "CX(1, 2); RZ({gamma})(2); CX(1, 2); "
+    circuit += "RX({beta})(0); RX({beta})(1); RX({beta})(2)"
+    return circuit.format(beta=beta, gamma=gamma).split("; ")
+
+
+def test_qaoa_notebook():
+    circuit = qs.qaoa([(0, 1), (1, 2)], None, 1, [np.pi/2], [np.pi/4])
+    expected = notebook_circuit("PI/2", "PI/4")
+    assert len(circuit) == len(expected)
+    for g0, g1 in zip(circuit, expected):
+        assert qs.gate_info(g0) == qs.gate_info(g1)
+
+
+def test_qaoa():
+    edges = np.array([(0, 1), (1, 3), (3, 2), (2, 0)])
+    weights = np.array([1., 2., .5, -1.])
+    betas, gammas = np.array([.1, .2, .3]), np.array([.4, .5, .6])
+
+    # the circuit written out by hand
+    expected = ["H(0)", "H(1)", "H(2)", "H(3)"]
+    for beta, gamma in zip(betas, gammas):
+        for (i, j), w in zip(edges, weights):
+            expected.extend([
+                "CX(%d, %d)" % (i, j),
+                "RZ(%r)(%d)" % (float(gamma * w), j),
+                "CX(%d, %d)" % (i, j)
+            ])
+        expected.extend("RX(%r)(%d)" % (float(beta), q) for q in range(4))
+
+    assert qs.qaoa(edges, weights, 3, betas, gammas) == expected
+
+    qaoa = qs.QAOA(edges, weights)
+    assert qaoa.num_qubits == 4
+    assert qaoa.circuit(betas, gammas) == expected
+    # new angles only change the angles
+    circuit = qaoa.circuit(betas + 1, gammas)
+    assert len(circuit) == len(expected)
+    assert [qs.gate_info(g)[2] for g in circuit] == [
+        qs.gate_info(g)[2] for g in expected
+    ]
+
+    cirq_circuit = qaoa.circuit(betas, gammas, qs.Cirq)
+    assert qs.Cirq.to_qusetta(cirq_circuit) == qs.Cirq.to_qusetta(
+        qs.Cirq.from_qusetta(expected)
+    )
+
+    # qiskit binds the angles to the same parameterized circuit
+    qiskit_circuit = qaoa.circuit(betas, gammas, qs.Qiskit)
+    qiskit_circuit = qs.Qiskit.to_qusetta(qiskit_circuit)
+    assert len(qiskit_circuit) == len(expected)
+    for g0, g1 in zip(qiskit_circuit, expected):
+        name, params, qubits = qs.gate_info(g1)
+        assert qs.gate_info(g0)[::2] == (name, qubits)
+        np.testing.assert_allclose(qs.gate_info(g0)[1], params)
+    qaoa.circuit(betas + 1, gammas, qs.Qiskit)
+    assert len(qaoa._qiskit) == int(qs._qaoa.ASSIGN_PARAMETERS)
+
+    assert len(qs.QAOA(edges, num_qubits=6).circuit([], [])) == 6
+
+    # a graph without edges has no cost layer
+    qaoa = qs.QAOA(np.zeros((0, 2)), num_qubits=3)
+    expected = ["H(0)", "H(1)", "H(2)", "RX(0.1)(0)", "RX(0.1)(1)",
+                "RX(0.1)(2)"]
+    assert qaoa.circuit([.1], [.2]) == expected
+    for representation in (qs.Cirq, qs.Qiskit, qs.Quasar):
+        circuit = representation.to_qusetta(
+            qaoa.circuit([.1], [.2], representation)
+        )
+        assert len(circuit) == len(expected)
+        for g0, g1 in zip(qs.parse(circuit), qs.parse(expected)):
+            assert g0[::2] == g1[::2]
+            np.testing.assert_allclose(g0[1], g1[1])
+
+
+def test_qaoa_errors():
+    with np.testing.assert_raises(ValueError):
+        qs.QAOA([(0, 1)], [1., 2.])
+    with np.testing.assert_raises(ValueError):
+        qs.QAOA([(0, 0)])
+    with np.testing.assert_raises(ValueError):
+        qs.QAOA([(0, 1)]).circuit([1.], [1., 2.])
+    with np.testing.assert_raises(ValueError):
+        qs.qaoa([(0, 1)], None, 2, [1.], [1.])
@@ -0,0 +1,73 @@
+"""Test random circuits."""
+
+from qusetta import gate_info, random_circuit
+from qusetta import PARAMETER_FREE_GATES, PARAMETER_GATES
+import numpy as np
+
+
+def test_random_circuit():
+    circuit = random_circuit(5, 200, seed=3)
+    assert len(circuit) == 200
+    assert circuit == random_circuit(5, 200, seed=3)
+    assert circuit != random_circuit(5, 200, seed=4)
+
+    structured = random_circuit(5, 200, seed=3, structured=True)
+    assert [gate_info(gate) for gate in circuit] == structured
+
+    names = set()
+    for g, params, qubits in structured:
+        names.add(g)
+        assert len(set(qubits)) == len(qubits)
+        assert all(0 <= q < 5 for q in qubits)
+        assert len(params) == (g in PARAMETER_GATES)
+        assert all(-2*np.pi <= x <= 2*np.pi for x in params)
+    assert names == PARAMETER_FREE_GATES | PARAMETER_GATES
+
+
+def test_random_circuit_batch():
+    circuits = random_circuit(4, 50, seed=1, batch=3)
+    assert len(circuits) == 3
+    assert all(len(circuit) == 50 for circuit in circuits)
+    assert circuits[0] != circuits[1]
+    assert circuits == random_circuit(4, 50, seed=1, batch=3)
+    assert random_circuit(4, 0, seed=1, batch=2) == [[], []]
+
+
+def test_random_circuit_options():
+    circuit = random_circuit(2, 100, ["h", "CX", "CCX", "RZ"], seed=0,
+                             structured=True)
+    assert {g for g, _, _ in circuit} == {"H", "CX", "RZ"}
+    assert {g for g, _, _ in random_circuit(1, 100, seed=0,
+                                            structured=True)} <= {
+        g for g in PARAMETER_FREE_GATES | PARAMETER_GATES
+        if g not in ("CX", "CZ", "SWAP", "CCX")
+    }
+
+    for fraction in 0, 1:
+        circuit = random_circuit(
+            4, 100, multi_qubit_fraction=fraction, seed=0, structured=True
+        )
+        assert all((len(qubits) > 1) == fraction for _, _, qubits in circuit)
+    circuit = random_circuit(
+        4, 10000, ["H", "CX"], multi_qubit_fraction=0.2, seed=0,
+        structured=True
+    )
+    assert abs(sum(g == "CX" for g, _, _ in circuit) / 10000 - 0.2) < 0.02
+
+    circuit = random_circuit(3, 100, ["RX"], angles=(0, 0.1), seed=0,
+                             structured=True)
+    assert all(0 <= params[0] <= 0.1 for _, params, _ in circuit)
+    circuit = random_circuit(
+        3, 100, ["RY"], seed=0, structured=True,
+        angles=lambda rng, size: rng.choice([np.pi, -np.pi], size)
+    )
+    assert {params for _, params, _ in circuit} == {(np.pi,), (-np.pi,)}
+
+    with np.testing.assert_raises(NotImplementedError):
+        random_circuit(3, 10, ["H", "U3"])
+    with np.testing.assert_raises(ValueError):
+        random_circuit(1, 10, ["CX"])
+    with np.testing.assert_raises(ValueError):
+        random_circuit(3, 10, ["CX"], multi_qubit_fraction=0.5)
+    with np.testing.assert_raises(ValueError):
+        random_circuit(3, 10, multi_qubit_fraction=1.5)
@@ -0,0 +1,41 @@
+"""Test rescheduling circuits."""
+
+from qusetta import Block, Cirq, Quasar, random_circuit, reschedule
+from test_translation import Simulator
+import numpy as np
+
+
+def test_reschedule():
+    circuit = ["H(0)", "CZ(0, 1)", "RZ(0.5)(1)"]
+    assert reschedule(circuit) == ["H(0)", "RZ(0.5)(1)", "CZ(0, 1)"]
+
+    # the RZ and T gates commute with the controls, the RX with the target
+    circuit = [
+        "H(0)", "H(1)", "CX(0, 2)", "CX(1, 2)",
+        "RZ(0.1)(0)", "T(1)", "RX(0.3)(2)"
+    ]
+    assert len(Cirq.from_qusetta(circuit)) == 4
+    assert len(Cirq.from_qusetta(reschedule(circuit))) == 3
+
+    # nothing moves past a gate that it doesn't commute with, or a block
+    circuit = ["H(0)", "CX(0, 1)", "H(1)", "RZ(0.2)(1)"]
+    assert reschedule(circuit) == circuit
+    circuit = ["RZ(0.2)(0)", Block(["Z(0)"], 2), "Z(0)"]
+    assert reschedule(circuit) == circuit
+
+    assert reschedule([]) == []
+
+
+def test_reschedule_random():
+    for circuit in random_circuit(5, 30, seed=0, batch=50):
+        new_circuit = reschedule(circuit)
+        assert sorted(new_circuit) == sorted(circuit)
+        assert (
+            len(Cirq.from_qusetta(new_circuit)) <=
+            len(Cirq.from_qusetta(circuit))
+        )
+        np.testing.assert_allclose(
+            Simulator.quasar(Quasar.from_qusetta(new_circuit)),
+            Simulator.quasar(Quasar.from_qusetta(circuit)),
+            atol=1e-10
+        )
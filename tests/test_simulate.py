@@ -0,0 +1,72 @@
+"""Test simulating circuits."""
+
+from qusetta import Block, Cirq, Qiskit, Quasar, random_circuit, simulate
+from qusetta import _simulate
+from test_translation import Simulator
+import numpy as np
+
+
+def test_simulate():
+    circuit = ["H(0)", "CX(0, 1)", "RX(0.3)(3)"]
+    # qubit 2 isn't used, so the reference needs an identity on it
+    probs = np.abs(Simulator.cirq(Cirq.from_qusetta(["I(2)"] + circuit))) ** 2
+    for backend in Cirq, Qiskit, Quasar:
+        np.testing.assert_allclose(
+            simulate(circuit, [backend], probabilities=True), probs,
+            atol=1e-12
+        )
+
+    # qubits that no gate acts on are still in the statevector
+    np.testing.assert_allclose(
+        simulate(["X(2)"], probabilities=True), [0, 1, 0, 0, 0, 0, 0, 0]
+    )
+    assert simulate([], probabilities=True).tolist() == [1]
+    np.testing.assert_allclose(
+        simulate([Block(["H(0)"], 2)], [Quasar]), [1, 0], atol=1e-12
+    )
+
+    with np.testing.assert_raises(ValueError):
+        simulate(circuit, [])
+    with np.testing.assert_raises(ValueError):
+        simulate(circuit, [Block])
+
+
+def test_simulate_random():
+    for circuit in random_circuit(4, 30, seed=1, batch=20):
+        states = [simulate(circuit, [b]) for b in (Cirq, Qiskit, Quasar)]
+        for state in states[1:]:
+            np.testing.assert_allclose(
+                np.abs(state) ** 2, np.abs(states[0]) ** 2, atol=1e-10
+            )
+            # the same up to a global phase
+            assert abs(abs(np.vdot(state, states[0])) - 1) < 1e-10
+
+
+def test_autotune(monkeypatch):
+    calls = []
+
+    def fake(backend):
+        def simulator(circuit, n):
+            calls.append(backend)
+            return np.eye(2 ** n)[0]
+        return simulator
+
+    monkeypatch.setattr(_simulate, "_choices", {})
+    monkeypatch.setattr(_simulate, "SIMULATORS", {
+        b: fake(b) for b in (Cirq, Qiskit, Quasar)
+    })
+
+    circuit = ["H(0)", "CX(0, 1)"]
+    simulate(circuit)
+    assert calls == [Cirq, Qiskit, Quasar]
+    (choice,) = _simulate._choices.values()
+
+    # the same shape uses the choice
+    simulate(["X(1)", "CZ(1, 0)"])
+    assert calls[3:] == [choice]
+    # a new shape is tuned again
+    simulate(circuit + ["H(2)"])
+    assert len(calls) == 7
+    # no tuning
+    simulate(["H(5)"], [Qiskit, Cirq], autotune=False)
+    assert calls[7:] == [Qiskit]
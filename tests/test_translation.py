@@ -22,7 +22,9 @@ class Simulator:
 
     @staticmethod
     def cirq(circuit: cirq.Circuit) -> np.ndarray:
-        return Simulator.cirq_backend.simulate(circuit).final_state
+        return qs._simulate._final_state(
+            Simulator.cirq_backend.simulate(circuit)
+        )
 
     @staticmethod
     def qiskit(circuit: qiskit.QuantumCircuit) -> np.ndarray:
@@ -284,18 +286,21 @@ def test_circuit_0():
 def test_circuit_1():
     # test qiskit's u1, u2, and u3 gates
 
+    # (QuantumCircuit.u1, etc are gone from newer versions of qiskit)
+    library = qiskit.circuit.library
     qiskit_circuit = qiskit.QuantumCircuit(4)
+    q = qiskit_circuit.qubits
     qiskit_circuit.h(0)
     qiskit_circuit.h(2)
-    qiskit_circuit.u1(pi/6, 1)
-    qiskit_circuit.u2(1, 2, 0)
+    qiskit_circuit.append(library.U1Gate(pi/6), [q[1]])
+    qiskit_circuit.append(library.U2Gate(1, 2), [q[0]])
     qiskit_circuit.ccx(1, 0, 3)
     qiskit_circuit.ccx(0, 1, 2)
-    qiskit_circuit.u3(1, 2, 3, 1)
+    qiskit_circuit.append(library.U3Gate(1, 2, 3), [q[1]])
     qiskit_circuit.rx(pi/3, 1)
-    qiskit_circuit.u3(1.56, 1.24, 1.69, 2)
-    qiskit_circuit.u2(1.2, 5.1, 1)
-    qiskit_circuit.u1(6.542, 0)
+    qiskit_circuit.append(library.U3Gate(1.56, 1.24, 1.69), [q[2]])
+    qiskit_circuit.append(library.U2Gate(1.2, 5.1), [q[1]])
+    qiskit_circuit.append(library.U1Gate(6.542), [q[0]])
 
     qusetta_circuit = qs.Qiskit.to_qusetta(qiskit_circuit)
     cirq_circuit = qs.Cirq.from_qusetta(qusetta_circuit)
@@ -329,3 +334,250 @@ def test_circuit_2():
 
     # tests
     all_tests(qusetta_circuit, cirq_circuit, qiskit_circuit, quasar_circuit)
+
+
+def test_circuit_3():
+    # test repeated blocks
+
+    layer = qs.Block([
+        "CX(0, 2)", "RZ(0.3)(2)", "CX(0, 2)",
+        qs.Block(["RX(0.2)(0)", "H(2)", "T(1)"], 2, "inner")
+    ], 3, "layer")
+    qusetta_circuit = ["H(0)", "H(1)", "H(2)", layer, "RY(0.7)(1)", layer]
+
+    cirq_circuit = qs.Cirq.from_qusetta(qusetta_circuit)
+    qiskit_circuit = qs.Qiskit.from_qusetta(qusetta_circuit)
+    quasar_circuit = qs.Quasar.from_qusetta(qusetta_circuit)
+
+    # qiskit keeps the blocks, and only builds each one once
+    assert qs.Qiskit.to_qusetta(qiskit_circuit) == qusetta_circuit
+    assert len(qiskit_circuit) == 6
+    assert qiskit_circuit.data[3][0] is qiskit_circuit.data[5][0]
+
+    # blocks of one shared gate aren't mistaken for repeated blocks
+    for circuit in (
+        [qs.Block(["H(0)", "H(1)"])], ["X(0)", qs.Block(["X(0)", "X(1)"])],
+        [qs.Block(["H(0)", "H(0)"], 2, "twice")]
+    ):
+        assert qs.Qiskit.to_qusetta(qs.Qiskit.from_qusetta(circuit)) == circuit
+    sub = qiskit.QuantumCircuit(2, name="hh")
+    sub.h(0)
+    sub.h(1)
+    composite = qiskit.QuantumCircuit(2)
+    composite.append(sub.to_instruction(), composite.qubits)
+    assert qs.Qiskit.to_qusetta(composite) == [
+        qs.Block(["H(1)", "H(0)"], 1, "hh")
+    ]
+
+    # composites of circuits with many registers
+    a, b = qiskit.QuantumRegister(1, "a"), qiskit.QuantumRegister(2, "b")
+    sub = qiskit.QuantumCircuit(a, b, name="multi")
+    sub.h(b[1])
+    sub.cx(a[0], b[0])
+    composite = qiskit.QuantumCircuit(3)
+    composite.append(sub.to_instruction(), composite.qubits)
+    assert qs.Qiskit.to_qusetta(composite) == [
+        qs.Block(["H(0)", "CX(2, 1)"], 1, "multi")
+    ]
+
+    # so does cirq, in the versions that have CircuitOperation
+    if qs._cirq.PARENT_PATH:
+        assert [
+            op.parent_path for op in cirq_circuit.all_operations()
+            if isinstance(op, cirq.CircuitOperation)
+        ] == [("layer",), ("layer",)]
+        # (a block of measurements only, which to_qusetta ignores)
+        block = cirq.CircuitOperation(
+            cirq.FrozenCircuit(cirq.measure(cirq.LineQubit(0))),
+            repetitions=2, parent_path=("measure",)
+        )
+        assert qs.Cirq.to_qusetta(cirq.Circuit(block)) == [
+            qs.Block([], 2, "measure")
+        ]
+        # each block is only lowered once
+        operations = list(cirq_circuit.all_operations())
+        assert operations[3] is operations[5]
+
+        q = cirq.LineQubit.range(2)
+        body = cirq.FrozenCircuit(
+            cirq.H(q[0]), cirq.S(q[1]), cirq.rx(0.5)(q[1]), cirq.CZ(*q)
+        )
+
+        def assert_block(block, circuit, repetitions):
+            [res] = qs.Cirq.to_qusetta(cirq.Circuit(block))
+            assert res.repetitions == repetitions
+            assert len(res.circuit) == len(circuit)
+            for g0, g1 in zip(qs.parse(res.circuit), qs.parse(circuit)):
+                assert g0[::2] == g1[::2]
+                np.testing.assert_allclose(g0[1], g1[1])
+            return res.circuit
+
+        # repetition ids
+        block = cirq.CircuitOperation(
+            body, repetitions=2, repetition_ids=["a", "b"]
+        )
+        assert_block(block, ["H(0)", "S(1)", "RX(0.5)(1)", "CZ(0, 1)"], 2)
+        # negative repetitions are the inverse
+        block = cirq.CircuitOperation(body, repetitions=-2)
+        circuit = assert_block(block, [
+            "CZ(0, 1)", "RX(-0.5)(1)", "RZ(-PI/2)(1)", "H(0)"
+        ], 2)
+        [res] = qs.Cirq.to_qusetta(cirq.Circuit(block), structured=True)
+        assert res.circuit == qs.parse(circuit)
+        circuit = qs.unroll([qs.Block(circuit, 2)])
+        assert_equal(
+            qs.Quasar.from_qusetta(circuit), cirq.Circuit(block),
+            Simulator.quasar, Simulator.cirq
+        )
+
+    # tests
+    all_tests(qusetta_circuit, cirq_circuit, qiskit_circuit, quasar_circuit)
+    all_tests(
+        qs.unroll(qusetta_circuit),
+        cirq_circuit, qiskit_circuit, quasar_circuit
+    )
+
+
+def test_qiskit_from_qusetta():
+    # from_qusetta builds the circuit directly, check that it's the same as
+    # building it with qiskit's methods
+
+    qusetta_circuit = [
+        "H(0)", "CX(0, 1)", "RZ(0.5)(1)", "H(0)", "CCX(2, 0, 1)",
+        "SWAP(0, 2)", "I(1)", "RX(-PI/3)(2)", "CZ(1, 0)"
+    ]
+
+    qiskit_circuit = qiskit.QuantumCircuit(3)
+    qiskit_circuit.h(2)
+    qiskit_circuit.cx(2, 1)
+    qiskit_circuit.rz(0.5, 1)
+    qiskit_circuit.h(2)
+    qiskit_circuit.ccx(0, 2, 1)
+    qiskit_circuit.swap(2, 0)
+    qiskit_circuit.i(1)
+    qiskit_circuit.rx(-pi/3, 0)
+    qiskit_circuit.cz(1, 2)
+
+    assert qs.Qiskit.from_qusetta(qusetta_circuit) == qiskit_circuit
+
+    # the same checks as qiskit's methods
+    for circuit in (
+        ["CX(0, 0)"], ["H(0, 1)"], ["CCX(0, 1)"], ["H(-1)", "X(1)"],
+        [qs.Block(["H(-1)"])]
+    ):
+        with np.testing.assert_raises(
+            qiskit.circuit.exceptions.CircuitError
+        ):
+            qs.Qiskit.from_qusetta(circuit)
+
+
+def test_quasar_from_qusetta():
+    # from_qusetta places the gates itself, check that they're where
+    # quasar would have put them
+
+    qusetta_circuit = [
+        "H(0)", "CX(0, 1)", "RZ(0.5)(1)", "H(3)", "CCX(2, 0, 1)",
+        "SWAP(0, 2)", "I(1)", "RX(-PI/3)(2)", "CZ(1, 3)", "T(0)"
+    ]
+
+    quasar_circuit = quasar.Circuit()
+    quasar_circuit.H(0)
+    quasar_circuit.CX(0, 1)
+    quasar_circuit.Rz(1, 0.25)
+    quasar_circuit.H(3)
+    quasar_circuit.CCX(2, 0, 1)
+    quasar_circuit.SWAP(0, 2)
+    quasar_circuit.I(1)
+    quasar_circuit.Rx(2, -pi/6)
+    quasar_circuit.CZ(1, 3)
+    quasar_circuit.T(0)
+
+    circuit = qs.Quasar.from_qusetta(qusetta_circuit)
+    assert list(circuit.gates) == list(quasar_circuit.gates)
+    for key, gate in circuit.gates.items():
+        assert gate.name == quasar_circuit.gates[key].name
+        assert gate.parameters == quasar_circuit.gates[key].parameters
+
+    assert qs.Quasar.to_qusetta(circuit, structured=True) == [
+        qs.gate_info(gate)
+        for gate in qs.Quasar.to_qusetta(quasar_circuit)
+    ]
+
+
+def test_workers():
+    # converting in chunks across processes gives the same circuits
+
+    qusetta_circuit = [
+        "H(0)", "CX(0, 1)", "RZ(0.5)(1)", "H(3)", "CCX(2, 0, 1)",
+        "SWAP(0, 2)", "I(1)", "RX(-PI/3)(2)", "CZ(1, 3)", "T(0)",
+        qs.Block(["RY(0.25)(3)", "CX(3, 2)"], 2), "S(1)", "Y(2)"
+    ]
+
+    for backend in qs.Cirq, qs.Qiskit:
+        circuit = backend.from_qusetta(qusetta_circuit)
+        assert backend.from_qusetta(qusetta_circuit, workers=3) == circuit
+
+    circuit = qs.Quasar.from_qusetta(qusetta_circuit)
+    assert (
+        list(qs.Quasar.from_qusetta(qusetta_circuit, workers=3).gates) ==
+        list(circuit.gates)
+    )
+    assert (
+        qs.Quasar.to_qusetta(circuit, workers=3) ==
+        qs.Quasar.to_qusetta(circuit)
+    )
+
+
+def test_qiskit_to_qusetta():
+
+    # qubits are reversed across all of the registers
+    a, b = qiskit.QuantumRegister(2, "a"), qiskit.QuantumRegister(1, "b")
+    qiskit_circuit = qiskit.QuantumCircuit(a, b)
+    qiskit_circuit.h(a[0])
+    qiskit_circuit.cx(a[1], b[0])
+    qiskit_circuit.rz(0.5, b[0])
+    assert qs.Qiskit.to_qusetta(qiskit_circuit) == [
+        "H(2)", "CX(1, 0)", "RZ(0.5)(0)"
+    ]
+    assert_equal(
+        qiskit_circuit, qs.Cirq.from_qiskit(qiskit_circuit),
+        Simulator.qiskit, Simulator.cirq
+    )
+
+    # angles are exact
+    qiskit_circuit = qiskit.QuantumCircuit(1)
+    # (QuantumCircuit.u3 is gone from newer versions of qiskit)
+    qiskit_circuit.append(
+        qiskit.circuit.library.U3Gate(0.123456789, 1.23456789, 2.3456789),
+        [qiskit_circuit.qubits[0]]
+    )
+    assert qs.Qiskit.to_qusetta(qiskit_circuit, structured=True) == [
+        ("RZ", (2.3456789 - pi/2,), (0,)),
+        ("RX", (0.123456789,), (0,)),
+        ("RZ", (1.23456789 + pi/2,), (0,))
+    ]
+    assert [
+        qs.gate_info(g) for g in qs.Qiskit.to_qusetta(qiskit_circuit)
+    ] == qs.Qiskit.to_qusetta(qiskit_circuit, structured=True)
+
+
+def test_cirq_to_qusetta():
+    q = cirq.LineQubit.range(3)
+    cirq_circuit = cirq.Circuit(
+        cirq.H(q[0]), cirq.CNOT(q[0], q[1]), cirq.rx(0.5)(q[2]),
+        cirq.TOFFOLI(*q), cirq.T(q[1])
+    )
+    assert qs.Cirq.to_qusetta(cirq_circuit, structured=True) == qs.parse(
+        qs.Cirq.to_qusetta(cirq_circuit)
+    )
+
+
+def test_keyword_only():
+    # the options of the conversions can't be given positionally
+    qusetta_circuit = ["H(0)", "CX(0, 1)"]
+    for backend in qs.Cirq, qs.Qiskit, qs.Quasar:
+        circuit = backend.from_qusetta(qusetta_circuit)
+        with np.testing.assert_raises(TypeError):
+            backend.from_qusetta(qusetta_circuit, 2)
+        with np.testing.assert_raises(TypeError):
+            backend.to_qusetta(circuit, True)